@@ -13,8 +13,11 @@ from homeassistant.helpers import device_registry as dr
 from .const import (
     CONF_MEDIUM_POLL_INTERVAL,
     CONF_POLL_INTERVAL,
+    CONF_POLLING_STYLE,
+    DATA_POLL_SLOTS,
     DEFAULT_MEDIUM_POLL_INTERVAL,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_POLLING_STYLE,
     DOMAIN,
 )
 from .coordinator import MarstekDataUpdateCoordinator
@@ -40,6 +43,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     medium_poll_interval: int = entry.options.get(
         CONF_MEDIUM_POLL_INTERVAL, DEFAULT_MEDIUM_POLL_INTERVAL
     )
+    polling_style: str = entry.options.get(CONF_POLLING_STYLE, DEFAULT_POLLING_STYLE)
 
     # Check for duplicate device names in other entries
     for other_entry in hass.config_entries.async_entries(DOMAIN):
@@ -74,6 +78,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         device_name=device_name,
         poll_interval=poll_interval,
         medium_poll_interval=medium_poll_interval,
+        polling_style=polling_style,
     )
 
     # Start coordinator and wait for it to be ready
@@ -123,7 +128,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         domain_data = hass.data.get(DOMAIN)
         if domain_data:
             domain_data.pop(entry.entry_id, None)
-            if not domain_data:
+            # The shared poll slots go with the last entry.
+            if domain_data.keys() <= {DATA_POLL_SLOTS}:
                 hass.data.pop(DOMAIN)
 
     return unload_ok
@@ -140,3 +146,6 @@ async def _async_handle_entry_update(hass: HomeAssistant, entry: ConfigEntry) ->
         CONF_MEDIUM_POLL_INTERVAL, DEFAULT_MEDIUM_POLL_INTERVAL
     )
     coordinator.set_poll_intervals(poll_interval, medium_poll_interval)
+    coordinator.set_polling_style(
+        entry.options.get(CONF_POLLING_STYLE, DEFAULT_POLLING_STYLE)
+    )
@@ -17,14 +17,17 @@ from homeassistant.helpers import selector
 from .const import (
     CONF_MEDIUM_POLL_INTERVAL,
     CONF_POLL_INTERVAL,
+    CONF_POLLING_STYLE,
     DEFAULT_MEDIUM_POLL_INTERVAL,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_POLLING_STYLE,
     DEVICE_PREFIXES,
     DOMAIN,
     MAX_MEDIUM_POLL_INTERVAL,
     MAX_POLL_INTERVAL,
     MIN_MEDIUM_POLL_INTERVAL,
     MIN_POLL_INTERVAL,
+    POLLING_STYLES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -217,6 +220,9 @@ class MarstekBLEOptionsFlow(OptionsFlow):
         current_medium_interval = self._config_entry.options.get(
             CONF_MEDIUM_POLL_INTERVAL, DEFAULT_MEDIUM_POLL_INTERVAL
         )
+        current_polling_style = self._config_entry.options.get(
+            CONF_POLLING_STYLE, DEFAULT_POLLING_STYLE
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -242,6 +248,15 @@ class MarstekBLEOptionsFlow(OptionsFlow):
                             unit_of_measurement="s",
                         ),
                     ),
+                    vol.Required(
+                        CONF_POLLING_STYLE, default=current_polling_style
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=list(POLLING_STYLES),
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_POLLING_STYLE,
+                        ),
+                    ),
                 }
             ),
         )
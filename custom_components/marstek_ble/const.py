@@ -4,6 +4,7 @@ DOMAIN = "marstek_ble"
 
 CONF_POLL_INTERVAL = "poll_interval"
 CONF_MEDIUM_POLL_INTERVAL = "medium_poll_interval"
+CONF_POLLING_STYLE = "polling_style"
 
 # BLE Service and Characteristic UUIDs
 SERVICE_UUID = "0000ff00-0000-1000-8000-00805f9b34fb"
@@ -27,6 +28,60 @@ MAX_POLL_INTERVAL = 60
 MIN_MEDIUM_POLL_INTERVAL = 5
 MAX_MEDIUM_POLL_INTERVAL = 300
 
+# Polling styles: keep the configured fast interval, or retune it from observed
+# volatility with additive (AIMD) or multiplicative (MIMD) increases.
+POLLING_STYLE_FIXED = "fixed"
+POLLING_STYLE_AIMD = "aimd"
+POLLING_STYLE_MIMD = "mimd"
+POLLING_STYLES = (POLLING_STYLE_FIXED, POLLING_STYLE_AIMD, POLLING_STYLE_MIMD)
+DEFAULT_POLLING_STYLE = POLLING_STYLE_FIXED
+# Samples per volatility window and the per-field error margin; a window whose
+# mean absolute change stays below twice the margin counts as quiet.
+VOLATILITY_WINDOW = 5
+VOLATILITY_MARGINS = {
+    "battery_soc": 0.5,  # %
+    "battery_current": 0.5,  # A
+}
+AIMD_INCREASE = 5  # seconds added per quiet window
+MIMD_INCREASE = 1.5  # factor applied per quiet window
+
+# Keep the BLE link up between polls for this many fast intervals (at least
+# MIN_CONNECTION_IDLE_TIMEOUT seconds) instead of reconnecting every cycle.
+CONNECTION_IDLE_POLLS = 3
+MIN_CONNECTION_IDLE_TIMEOUT = 60
+
+# Seconds a failed connectable BLEDevice lookup is remembered before retrying.
+BLE_DEVICE_MISS_TTL = 2.0
+
+# Pipelined polling: reply timeout per command and commands kept in flight.
+COMMAND_RESPONSE_TIMEOUT = 2.0
+PIPELINE_DEPTH = 3
+
+# Connected devices exchanging poll commands at once across all entries; more
+# contend for the adapter. Connecting happens outside this limit, and each poll
+# tier (fast, then medium) takes the slot separately.
+MAX_CONCURRENT_POLLS = 1
+# hass.data[DOMAIN] key of the shared poll slot semaphore.
+DATA_POLL_SLOTS = "poll_slots"
+# Consecutive unanswered commands after which a poll skips the rest of its
+# commands, so a struggling device doesn't hold the shared slot for long.
+POLL_MISS_LIMIT = 3
+
+# Seconds to coalesce listener updates from notifications outside a poll.
+UPDATE_COALESCE_DELAY = 0.05
+
+# Adaptive medium polling: per-command change history kept, and samples required
+# before a command leaves the static medium schedule.
+ADAPTIVE_HISTORY = 32
+ADAPTIVE_MIN_SAMPLES = 5
+
+# Recent poll command outcomes kept for diagnostics.
+POLL_COMMAND_HISTORY = 64
+
+# Consecutive unanswered polls (on an otherwise working link) after which a
+# medium command that has never replied is dropped for that device.
+UNANSWERED_COMMAND_LIMIT = 5
+
 # Backoff intervals (seconds) applied after successive failures.
 BACKOFF_INTERVALS = (
     UPDATE_INTERVAL_FAST,  # Baseline (no backoff)
@@ -35,6 +90,9 @@ BACKOFF_INTERVALS = (
     30,
     60,
 )
+# Each device waits up to this extra fraction of a backoff window before
+# resuming, so devices sharing an adapter don't reconnect in lockstep.
+BACKOFF_JITTER = 0.5
 
 # Command codes
 CMD_RUNTIME_INFO = 0x03
@@ -2,31 +2,30 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import logging
 import math
 from datetime import timedelta
-import time
 from types import SimpleNamespace
+import zlib
 
 from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
-from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth.active_update_coordinator import (
     ActiveBluetoothDataUpdateCoordinator,
 )
-from homeassistant.core import CoreState, HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
 
 from .const import (
-    CHAR_NOTIFY_UUID,
-    CHAR_WRITE_UUID,
+    ADAPTIVE_HISTORY,
+    ADAPTIVE_MIN_SAMPLES,
+    AIMD_INCREASE,
     CMD_BMS_DATA,
     CMD_CONFIG_DATA,
     CMD_CT_POLLING_RATE,
     CMD_DEVICE_INFO,
-    CMD_LOCAL_API_STATUS,
     CMD_LOGS,
     CMD_METER_IP,
     CMD_NETWORK_INFO,
@@ -34,14 +33,32 @@ from .const import (
     CMD_SYSTEM_DATA,
     CMD_TIMER_INFO,
     CMD_WIFI_SSID,
+    COMMAND_RESPONSE_TIMEOUT,
+    CONNECTION_IDLE_POLLS,
+    DATA_POLL_SLOTS,
     DEFAULT_MEDIUM_POLL_INTERVAL,
     BACKOFF_INTERVALS,
+    BACKOFF_JITTER,
+    BLE_DEVICE_MISS_TTL,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_POLLING_STYLE,
+    DOMAIN,
+    MAX_CONCURRENT_POLLS,
     MAX_MEDIUM_POLL_INTERVAL,
     MAX_POLL_INTERVAL,
+    MIN_CONNECTION_IDLE_TIMEOUT,
     MIN_MEDIUM_POLL_INTERVAL,
     MIN_POLL_INTERVAL,
-    SERVICE_UUID,
+    MIMD_INCREASE,
+    PIPELINE_DEPTH,
+    POLL_COMMAND_HISTORY,
+    POLL_MISS_LIMIT,
+    POLLING_STYLE_AIMD,
+    POLLING_STYLE_MIMD,
+    UNANSWERED_COMMAND_LIMIT,
+    UPDATE_COALESCE_DELAY,
+    VOLATILITY_MARGINS,
+    VOLATILITY_WINDOW,
 )
 from .marstek_device import MarstekBLEDevice, MarstekData, MarstekProtocol
 
@@ -53,11 +70,91 @@ VERBOSE_LOGGER.setLevel(logging.INFO)
 
 _GLOBAL_BACKOFF_LEVEL: int = 0
 _GLOBAL_BACKOFF_UNTIL: float | None = None
+# Address of the device whose failure set the backoff; only its recovery eases it.
+_GLOBAL_BACKOFF_OWNER: str | None = None
+
+
+def _poll_slots(hass: HomeAssistant) -> asyncio.Semaphore:
+    """Return the poll slots shared by every entry, so command exchanges
+    don't contend for the adapter.
+
+    Kept in hass.data rather than at module level so it belongs to the running
+    event loop and goes away with the last entry.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (slots := domain_data.get(DATA_POLL_SLOTS)) is None:
+        slots = domain_data[DATA_POLL_SLOTS] = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+    return slots
+
+
+class _ChangeModel:
+    """Online histogram of how long a command's reply stays unchanged.
+
+    Poll offsets (seconds since the last observed change) follow the Rascal
+    recurrence L_i = L_{i-1} + (F(L_{i-1}) - F(L_{i-2})) / p(L_{i-1}), which
+    spaces polls out where changes are unlikely and packs them where the
+    observed distribution has its mass.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty model."""
+        self._intervals: deque[float] = deque(maxlen=ADAPTIVE_HISTORY)
+
+    @property
+    def ready(self) -> bool:
+        """Return True once enough changes were observed to trust the model."""
+        return len(self._intervals) >= ADAPTIVE_MIN_SAMPLES
+
+    def add(self, interval: float) -> None:
+        """Record the time between two observed changes."""
+        self._intervals.append(interval)
+
+    def _cdf(self, offset: float) -> float:
+        """Return the fraction of changes that happened within ``offset``."""
+        return sum(1 for i in self._intervals if i <= offset) / len(self._intervals)
+
+    def _pdf(self, offset: float, bin_width: float) -> float:
+        """Return the histogram density around ``offset``."""
+        low = offset - bin_width / 2
+        high = offset + bin_width / 2
+        hits = sum(1 for i in self._intervals if low < i <= high)
+        return hits / len(self._intervals) / bin_width
+
+    def next_offset(
+        self, previous: float, current: float, bin_width: float
+    ) -> float | None:
+        """Return the next poll offset, or None if no change is expected."""
+        density = self._pdf(current, bin_width)
+        if density <= 0:
+            # Empty bin: skip ahead to the next offset where a change was seen.
+            later = [i for i in self._intervals if i > current]
+            return min(later) if later else None
+        return current + (self._cdf(current) - self._cdf(previous)) / density
 
 
 class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
     """Class to manage fetching Marstek data from BLE device."""
 
+    # Poll command specs as (cmd, payload, serial-fallback reply wait).
+    # Fast: runtime info and BMS, every poll.
+    _FAST_COMMANDS: tuple[tuple[int, bytes, float], ...] = (
+        (CMD_RUNTIME_INFO, b"", 0.1),
+        (CMD_BMS_DATA, b"", 0.1),
+    )
+    # Medium: system, WiFi, config, identity and logs, on the adaptive schedule.
+    _MEDIUM_COMMANDS: tuple[tuple[int, bytes, float], ...] = (
+        (CMD_SYSTEM_DATA, b"", 0.3),
+        (CMD_WIFI_SSID, b"", 0.3),
+        (CMD_CONFIG_DATA, b"", 0.3),
+        (CMD_CT_POLLING_RATE, b"", 0.3),
+        (CMD_METER_IP, b"\x0B", 0.3),
+        (CMD_NETWORK_INFO, b"", 0.3),
+        (CMD_DEVICE_INFO, b"", 0.3),
+        (CMD_TIMER_INFO, b"", 0.3),
+        (CMD_LOGS, b"", 0.3),
+    )
+    _MEDIUM_COMMAND_IDS = frozenset(cmd for cmd, _, _ in _MEDIUM_COMMANDS)
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -67,6 +164,7 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         device_name: str,
         poll_interval: int = DEFAULT_POLL_INTERVAL,
         medium_poll_interval: int = DEFAULT_MEDIUM_POLL_INTERVAL,
+        polling_style: str = DEFAULT_POLLING_STYLE,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -81,6 +179,10 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         self.ble_device = device
         self.device_name = device_name
         self._protocol = MarstekProtocol
+        # Bound once; the notification callback is the hottest path.
+        self._parse_notification = MarstekProtocol.parse_notification
+        # The loop's monotonic clock, bound once; every timestamp here uses it.
+        self._now = hass.loop.time
         self.data = MarstekData()
         self._connected = False
         self._fast_poll_count = 0
@@ -88,57 +190,161 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         self._ready_event = asyncio.Event()
         self._was_unavailable = True
         self._poll_interval = self._sanitize_fast_poll_interval(poll_interval)
+        # Configured fast interval; _poll_interval drifts from it when adaptive.
+        self._base_poll_interval = self._poll_interval
+        self._polling_style = polling_style
+        self._volatility: dict[str, list[float]] = {
+            field: [] for field in VOLATILITY_MARGINS
+        }
+        self._volatility_last: dict[str, float | None] = {}
         self._medium_poll_interval = self._sanitize_medium_poll_interval(
             medium_poll_interval
         )
-        self._medium_poll_cycle = 1
+        # Loop time at which the medium tier is next due (0.0: on the first poll).
+        self._next_medium_mono = 0.0
+        # Per-device salt de-phasing time polls and backoff resumption.
+        self._address_salt = zlib.crc32(address.encode())
+        self._medium_slack = 0.0
         self._last_poll_started_at: float | None = None
         self._last_poll_completed_at: float | None = None
-        self._current_poll_commands: list[dict[str, object]] = []
+        # (cmd, success, duration) of recent poll commands; dicts are built on demand.
+        self._poll_command_history: deque[tuple[int, bool, float]] = deque(
+            maxlen=POLL_COMMAND_HISTORY
+        )
+        self._cycle_commands = 0
+        self._cycle_failures = 0
+        # Unanswered commands in a row this cycle; see POLL_MISS_LIMIT.
+        self._cycle_misses = 0
+        # Per-command futures resolved by _handle_notification when the reply lands.
+        self._pending: dict[int, asyncio.Future[None]] = {}
+        # Adaptive medium schedule: per-command change models and next due times.
+        # This device's medium table; commands it never answers are dropped.
+        self._medium_commands = self._MEDIUM_COMMANDS
+        self._answered_commands: set[int] = set()
+        self._unanswered_polls: dict[int, int] = {}
+        self._dropped_commands: list[int] = []
+        self._change_models: dict[int, _ChangeModel] = {}
+        self._last_payloads: dict[int, bytes] = {}
+        self._last_change_at: dict[int, float] = {}
+        self._last_poll_offset: dict[int, float] = {}
+        self._next_due: dict[int, float] = {}
         self._last_service_info: bluetooth.BluetoothServiceInfoBleak | None = None
+        # Latest connectable BLEDevice from advertisements, to spare manager lookups.
+        self._cached_ble_device: BLEDevice | None = None
+        self._cached_ble_device_at = 0.0
+        self._ble_device_ttl = 0.0
         self._time_poll_unsub: asyncio.TimerHandle | None = None
-        self._poll_lock = asyncio.Lock()
+        # Set by the async_start stop callback; a poll finishing after unload
+        # must not re-arm the time poll.
+        self._stopped = False
+        self._time_poll_task_name = f"marstek_ble time poll {address}"
+        self._next_poll_mono = 0.0
+        # Result of the running poll; overlapping triggers share it, not queue.
+        self._poll_in_flight: asyncio.Future[MarstekData] | None = None
+        # Parsed notifications mark data dirty; listeners are notified once per poll.
+        self._pending_update = False
+        self._flush_unsub: asyncio.TimerHandle | None = None
         self._initial_poll_done = False
-        self._update_poll_schedule()
+        self._poll_slots = _poll_slots(hass)
 
         # Create persistent device object for command sending (SwitchBot pattern)
         self.device = MarstekBLEDevice(
             ble_device=device,
             device_name=device_name,
-            ble_device_callback=lambda: bluetooth.async_ble_device_from_address(
-                self.hass, address, connectable=True
-            ),
+            ble_device_callback=self._connectable_ble_device,
             notification_callback=self._handle_notification,
         )
+        self._update_poll_schedule()
 
     async def _send_and_sleep(
         self, command: int, payload: bytes = b"", delay: float = 0.3
     ) -> None:
-        """Send a command and optionally wait for a response window."""
-        start = time.monotonic()
-        wall_time = time.time()
-        error: Exception | None = None
+        """Send a command and wait up to ``delay`` for its reply to arrive."""
+        start = self._now()
         success = False
+        response = self.hass.loop.create_future()
+        self._pending[command] = response
         try:
             if not await self.device.send_command(command, payload):
                 raise BleakError(f"Failed to send command 0x{command:02X}")
             success = True
-            if delay:
-                await asyncio.sleep(delay)
+            if delay and not response.done():
+                try:
+                    await asyncio.wait_for(response, timeout=delay)
+                except TimeoutError:
+                    VERBOSE_LOGGER.debug(
+                        "[%s/%s] No parsed reply for 0x%02X within %.1fs",
+                        self.device_name,
+                        self.address,
+                        command,
+                        delay,
+                    )
+        finally:
+            if self._pending.get(command) is response:
+                del self._pending[command]
+            self._record_poll_command(
+                command, payload, success, start
+            )
+
+    async def _send_and_await(
+        self,
+        command: int,
+        payload: bytes,
+        timeout: float = COMMAND_RESPONSE_TIMEOUT,
+    ) -> None:
+        """Write a command without acknowledgement and await its reply."""
+        start = self._now()
+        response = self.hass.loop.create_future()
+        self._pending[command] = response
+        frame: bytes | None = None
+        try:
+            frame = await self.device.write_command(command, payload)
+            await asyncio.wait((response,), timeout=timeout)
         except Exception as err:  # noqa: BLE001
-            error = err
-            raise
+            _LOGGER.warning(
+                "[%s/%s] Pipelined command 0x%02X failed (continuing poll): %s",
+                self.device_name,
+                self.address,
+                command,
+                err,
+            )
         finally:
-            duration = time.monotonic() - start
-            cmd_entry = {
-                "cmd": command,
-                "payload": payload.hex(),
-                "success": success,
-                "duration": duration,
-                "wall_time": wall_time,
-                "error": str(error) if error else None,
-            }
-            self._current_poll_commands.append(cmd_entry)
+            if self._pending.get(command) is response:
+                del self._pending[command]
+            success = response.done()
+            if frame is not None:
+                if not success:
+                    _LOGGER.warning(
+                        "[%s/%s] Timeout waiting for reply to pipelined command 0x%02X",
+                        self.device_name,
+                        self.address,
+                        command,
+                    )
+                self.device.record_command_result(
+                    cmd=command,
+                    frame=frame,
+                    attempts=1,
+                    success=success,
+                    error=None if success else "no_response",
+                )
+            self._record_poll_command(command, payload, success, start)
+
+    def _record_poll_command(
+        self, command: int, payload: bytes, success: bool, start: float
+    ) -> None:
+        """Record the outcome of a poll command for the current cycle."""
+        duration = self._now() - start
+        self._poll_command_history.append((command, success, duration))
+        self._cycle_commands += 1
+        if success:
+            self._cycle_misses = 0
+            self._answered_commands.add(command)
+            self._unanswered_polls.pop(command, None)
+        else:
+            self._cycle_failures += 1
+            self._cycle_misses += 1
+            self._unanswered_polls[command] = self._unanswered_polls.get(command, 0) + 1
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
             VERBOSE_LOGGER.debug(
                 "[%s/%s] Poll command 0x%02X %s in %.3fs (payload=%s)",
                 self.device_name,
@@ -214,24 +420,76 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
 
     def _update_poll_schedule(self) -> None:
         """Recalculate polling schedule derived from the fast interval."""
+        if self._stopped:
+            return
         self.update_interval = timedelta(seconds=self._poll_interval)
-        self._medium_poll_cycle = max(
-            1, math.ceil(self._medium_poll_interval / self._poll_interval)
+        # Half a fast interval of slack keeps timer jitter from skipping a medium cycle.
+        self._medium_slack = self._poll_interval / 2
+        # An advertised BLEDevice stays usable for two fast intervals.
+        self._ble_device_ttl = 2 * self._poll_interval
+        # Hold the link across polls; reconnecting costs far more than idling.
+        self._connection_idle_timeout = max(
+            MIN_CONNECTION_IDLE_TIMEOUT, self._poll_interval * CONNECTION_IDLE_POLLS
         )
-        if self._time_poll_unsub:
-            self._time_poll_unsub()
-            self._time_poll_unsub = None
-        # Start a strict time-based poll regardless of advertisements.
-        self._time_poll_unsub = async_track_time_interval(
-            self.hass, self._async_time_poll, timedelta(seconds=self._poll_interval)
+        self.device.set_idle_timeout(self._connection_idle_timeout)
+        # Start a strict time-based poll regardless of advertisements, scheduled
+        # on the loop's monotonic clock rather than wall-clock ticks. A per-device
+        # phase keeps devices set to the same interval from firing together.
+        self._cancel_time_poll()
+        phase = (self._address_salt & 0xFFFF) / 0x10000 * self._poll_interval
+        self._next_poll_mono = self._now() + self._poll_interval + phase
+        self._time_poll_unsub = self.hass.loop.call_at(
+            self._next_poll_mono, self._schedule_time_poll
         )
         _LOGGER.debug(
-            "Polling schedule updated: fast=%ss, medium=%ss (every %s updates)",
+            "Polling schedule updated: fast=%ss, medium=%ss",
             self._poll_interval,
             self._medium_poll_interval,
-            self._medium_poll_cycle,
         )
 
+    def _cancel_time_poll(self) -> None:
+        """Cancel the pending time-based poll, if any."""
+        if self._time_poll_unsub:
+            self._time_poll_unsub.cancel()
+            self._time_poll_unsub = None
+
+    @callback
+    def _schedule_time_poll(self) -> None:
+        """Start a time-based poll and re-arm the timer for the next interval."""
+        if self._stopped:
+            return
+        now = self._now()
+        self._next_poll_mono += self._poll_interval
+        if self._next_poll_mono <= now:
+            # A stalled loop or long poll left us behind; don't fire a catch-up burst.
+            self._next_poll_mono = now + self._poll_interval
+        self._time_poll_unsub = self.hass.loop.call_at(
+            self._next_poll_mono, self._schedule_time_poll
+        )
+        self.hass.async_create_background_task(
+            self._async_time_poll(), self._time_poll_task_name
+        )
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start the coordinator; the returned callback also stops the time poll."""
+        stop = super().async_start()
+
+        @callback
+        def _async_stop() -> None:
+            global _GLOBAL_BACKOFF_OWNER
+            self._stopped = True
+            if _GLOBAL_BACKOFF_OWNER == self.address:
+                # Nobody else would ease a backoff owned by a removed device.
+                _GLOBAL_BACKOFF_OWNER = None
+            self._cancel_time_poll()
+            if self._flush_unsub:
+                self._flush_unsub.cancel()
+                self._flush_unsub = None
+            stop()
+
+        return _async_stop
+
     def set_poll_intervals(
         self, poll_interval: int, medium_poll_interval: int | None = None
     ) -> None:
@@ -244,7 +502,7 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
             sanitized_fast,
         )
         if (
-            sanitized_fast == self._poll_interval
+            sanitized_fast == self._base_poll_interval
             and sanitized_medium == self._medium_poll_interval
         ):
             return
@@ -252,12 +510,14 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         _LOGGER.info(
             "Updating polling intervals for %s: fast %ss -> %ss, medium %ss -> %ss",
             self.device_name,
-            self._poll_interval,
+            self._base_poll_interval,
             sanitized_fast,
             self._medium_poll_interval,
             sanitized_medium,
         )
+        self._base_poll_interval = sanitized_fast
         self._poll_interval = sanitized_fast
+        self._reset_volatility()
         self._medium_poll_interval = sanitized_medium
         self._fast_poll_count = 0
         self._medium_poll_count = 0
@@ -267,6 +527,97 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         """Update the fast polling interval (legacy helper)."""
         self.set_poll_intervals(poll_interval, self._medium_poll_interval)
 
+    def set_polling_style(self, polling_style: str) -> None:
+        """Switch between the fixed and adaptive (AIMD/MIMD) polling styles."""
+        if polling_style == self._polling_style:
+            return
+        _LOGGER.info(
+            "Updating polling style for %s: %s -> %s",
+            self.device_name,
+            self._polling_style,
+            polling_style,
+        )
+        self._polling_style = polling_style
+        self._reset_volatility()
+        if self._poll_interval != self._base_poll_interval:
+            self._poll_interval = self._base_poll_interval
+            self._update_poll_schedule()
+
+    def _reset_volatility(self) -> None:
+        """Drop the current volatility observation window."""
+        for deltas in self._volatility.values():
+            deltas.clear()
+        self._volatility_last.clear()
+
+    def _sample_volatility(self) -> None:
+        """Record how much the tracked values moved since the previous poll."""
+        for field, deltas in self._volatility.items():
+            value = getattr(self.data, field)
+            previous = self._volatility_last.get(field)
+            self._volatility_last[field] = value
+            if value is not None and previous is not None:
+                deltas.append(abs(value - previous))
+
+        if any(len(deltas) >= VOLATILITY_WINDOW for deltas in self._volatility.values()):
+            self._synchronize_poll_rate()
+            for deltas in self._volatility.values():
+                deltas.clear()
+
+    def _synchronize_poll_rate(self) -> None:
+        """Retune the fast interval from the last volatility window.
+
+        Quiet windows (mean absolute change below twice the error margin for
+        every tracked field) lengthen the interval, additively for AIMD and
+        multiplicatively for MIMD; any busy field halves it.
+        """
+        quiet = all(
+            sum(deltas) / len(deltas) < 2 * VOLATILITY_MARGINS[field]
+            for field, deltas in self._volatility.items()
+            if deltas
+        )
+        if quiet:
+            if self._polling_style == POLLING_STYLE_MIMD:
+                new_interval = math.ceil(self._poll_interval * MIMD_INCREASE)
+            else:
+                new_interval = self._poll_interval + AIMD_INCREASE
+            # Never outgrow the medium tier: medium >= fast must keep holding.
+            new_interval = min(
+                MAX_POLL_INTERVAL, self._medium_poll_interval, new_interval
+            )
+        else:
+            new_interval = max(MIN_POLL_INTERVAL, self._poll_interval // 2)
+
+        if new_interval == self._poll_interval:
+            return
+        _LOGGER.debug(
+            "[%s/%s] %s polling: %s window, fast interval %ss -> %ss",
+            self.device_name,
+            self.address,
+            self._polling_style.upper(),
+            "quiet" if quiet else "busy",
+            self._poll_interval,
+            new_interval,
+        )
+        self._poll_interval = new_interval
+        self._update_poll_schedule()
+
+    @callback
+    def _connectable_ble_device(self) -> BLEDevice | None:
+        """Return a connectable BLEDevice, reusing a recent advertisement's."""
+        age = self._now() - self._cached_ble_device_at
+        if self._cached_ble_device is not None:
+            if age < self._ble_device_ttl:
+                return self._cached_ble_device
+        elif age < BLE_DEVICE_MISS_TTL:
+            # No connectable path right now; don't re-ask on every advertisement.
+            return None
+        ble_device = bluetooth.async_ble_device_from_address(
+            self.hass, self.address, connectable=True
+        )
+        self._cached_ble_device = ble_device
+        self._cached_ble_device_at = self._now()
+        return ble_device
+
     @callback
     def _needs_poll(
         self,
@@ -274,25 +625,34 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         seconds_since_last_poll: float | None,
     ) -> bool:
         """Determine if polling is needed."""
+        # Advertisements arrive far more often than we poll; bail out before any
+        # lookups while the last poll (advertisement- or timer-driven) is fresh.
+        if (
+            seconds_since_last_poll is not None
+            and seconds_since_last_poll < self._poll_interval
+        ):
+            return False
+        if (
+            self._last_poll_started_at is not None
+            and self._now() - self._last_poll_started_at < self._poll_interval
+        ):
+            return False
+
         # Only poll if we have a connectable device
-        ble_device = bluetooth.async_ble_device_from_address(
-            self.hass, service_info.device.address, connectable=True
-        )
+        ble_device = self._connectable_ble_device()
         needs_poll = bool(ble_device)
-        last_poll_age = (
-            time.time() - self._last_poll_started_at
-            if self._last_poll_started_at
-            else None
-        )
 
-        VERBOSE_LOGGER.debug(
-            "_needs_poll called: ble_device=%s, seconds_since_last_poll=%s, last_poll_age=%.1f, interval=%ss, needs_poll=%s",
-            ble_device is not None,
-            seconds_since_last_poll,
-            last_poll_age if last_poll_age is not None else -1,
-            self._poll_interval,
-            needs_poll,
-        )
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            VERBOSE_LOGGER.debug(
+                "_needs_poll called: ble_device=%s, seconds_since_last_poll=%s, last_poll_age=%.1f, interval=%ss, needs_poll=%s",
+                ble_device is not None,
+                seconds_since_last_poll,
+                self._now() - self._last_poll_started_at
+                if self._last_poll_started_at
+                else -1,
+                self._poll_interval,
+                needs_poll,
+            )
 
         return needs_poll
 
@@ -300,17 +660,34 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         self, service_info: bluetooth.BluetoothServiceInfoBleak
     ) -> MarstekData:
         """Poll the device for data."""
-        async with self._poll_lock:
-            return await self._async_run_poll(service_info)
+        try:
+            data = await self._async_poll_once(service_info)
+        except Exception:
+            # The base class only notifies after a successful poll; don't strand
+            # data that notifications already delivered.
+            self._flush_updates()
+            raise
+        # The base class notifies listeners once this poll returns.
+        self._pending_update = False
+        return data
 
-    async def _async_time_poll(self, _now) -> None:
+    async def _async_time_poll(self) -> None:
         """Time-based poll fallback when no advertisements arrive."""
+        # Advertisement-driven polls already wait for a running core; match that
+        # here so startup isn't spent opening BLE links and bursting commands.
+        if self.hass.state is not CoreState.running:
+            VERBOSE_LOGGER.debug(
+                "[%s/%s] Time poll skipped: Home Assistant is %s",
+                self.device_name,
+                self.address,
+                self.hass.state,
+            )
+            return
+
         # Build a minimal service_info stand-in when we haven't seen fresh advertisements.
         service_info = self._last_service_info
         if service_info is None:
-            ble_dev = bluetooth.async_ble_device_from_address(
-                self.hass, self.address, connectable=True
-            )
+            ble_dev = self._connectable_ble_device()
             if not ble_dev:
                 _LOGGER.debug(
                     "[%s/%s] Time poll skipped: no connectable BLE device available",
@@ -320,16 +697,53 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
                 return
             service_info = SimpleNamespace(device=ble_dev)
 
-        async with self._poll_lock:
-            await self._async_run_poll(service_info)
+        try:
+            await self._async_poll_once(service_info)
+        finally:
+            self._flush_updates()
+
+    async def _async_poll_once(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> MarstekData:
+        """Run a poll, or share the result of the one already in flight.
+
+        An overlapping trigger waits for the running poll's data instead of
+        queueing a second command burst behind a slow link.
+        """
+        if (in_flight := self._poll_in_flight) is not None:
+            VERBOSE_LOGGER.debug(
+                "[%s/%s] Poll already in progress; sharing its result",
+                self.device_name,
+                self.address,
+            )
+            return await asyncio.shield(in_flight)
+
+        in_flight = self._poll_in_flight = self.hass.loop.create_future()
+        try:
+            data = await self._async_run_poll(service_info)
+        except asyncio.CancelledError:
+            # Only the owner was cancelled; waiters keep the current snapshot.
+            in_flight.set_result(self.data)
+            raise
+        except Exception as err:
+            in_flight.set_exception(err)
+            # Mark retrieved: the owner re-raises it even if nobody else waits.
+            in_flight.exception()
+            raise
+        else:
+            in_flight.set_result(data)
+            return data
+        finally:
+            self._poll_in_flight = None
 
     async def _async_run_poll(
         self, service_info: bluetooth.BluetoothServiceInfoBleak
     ) -> MarstekData:
         """Shared poll execution path (used by event and timer triggers)."""
-        now = time.time()
-        if _GLOBAL_BACKOFF_UNTIL and now < _GLOBAL_BACKOFF_UNTIL:
-            remaining = _GLOBAL_BACKOFF_UNTIL - now
+        now = self._now()
+        resume_at = self._backoff_resume_at()
+        if resume_at and now < resume_at:
+            remaining = resume_at - now
             _LOGGER.warning(
                 "[%s/%s] Backoff active (global); skipping poll with %0.1fs remaining",
                 self.device_name,
@@ -338,64 +752,143 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
             )
             return self.data
 
-        start_monotonic = time.monotonic()
-        wall_start = now
-        self._last_poll_started_at = wall_start
-        self._current_poll_commands = []
+        # One clock for poll timing: the loop's monotonic time, which timers use too.
+        start = self._now()
+        self._last_poll_started_at = start
+        self._cycle_commands = 0
+        self._cycle_failures = 0
+        self._cycle_misses = 0
         self._last_service_info = service_info
-        VERBOSE_LOGGER.debug(
-            "[%s/%s] Poll cycle start (interval=%ss, since_last=%.1fs) from %s",
-            self.device_name,
-            self.address,
-            self._poll_interval,
-            (wall_start - self._last_poll_completed_at)
-            if self._last_poll_completed_at
-            else -1,
-            service_info.device.address,
-        )
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            VERBOSE_LOGGER.debug(
+                "[%s/%s] Poll cycle start (interval=%ss, since_last=%.1fs) from %s",
+                self.device_name,
+                self.address,
+                self._poll_interval,
+                (start - self._last_poll_completed_at)
+                if self._last_poll_completed_at
+                else -1,
+                service_info.device.address,
+            )
 
         # Update BLE device reference
         self.ble_device = service_info.device
 
-        # Use persistent device object for polling (SwitchBot pattern)
-        # The device manages its own connection lifecycle
+        # Fast commands run every poll; medium ones once their deadline is reached.
+        run_medium = start >= self._next_medium_mono - self._medium_slack
+        tiers = [list(self._FAST_COMMANDS)]
+        if run_medium:
+            tiers.append(self._due_medium_commands())
 
-        # Fast poll (runs at the configured base interval)
-        await self._poll_fast()
-        self._fast_poll_count += 1
+        # Use persistent device object for polling (SwitchBot pattern). The whole
+        # cycle runs in one connection session; the device drops the link after
+        # the idle timeout if polling stops. The shared slot is taken only once
+        # connected, and per tier, so a device retrying its connect or a long
+        # medium tier doesn't stall every other entry.
+        try:
+            async with self.device.connected():
+                for tier in tiers:
+                    async with self._poll_slots:
+                        await self._run_commands(tier)
+                    if self._cycle_misses >= POLL_MISS_LIMIT:
+                        _LOGGER.debug(
+                            "[%s/%s] %d commands in a row unanswered; ending poll early",
+                            self.device_name,
+                            self.address,
+                            self._cycle_misses,
+                        )
+                        break
+        except (BleakError, TimeoutError) as err:
+            _LOGGER.warning(
+                "[%s/%s] Could not connect for poll; skipping cycle: %s",
+                self.device_name,
+                self.address,
+                err,
+            )
+            self._last_poll_completed_at = self._now()
+            self._handle_backoff(True)
+            return self.data
 
-        # Medium poll (~every configured medium interval)
-        if not self._initial_poll_done or self._fast_poll_count % self._medium_poll_cycle == 0:
-            await self._poll_medium()
+        if run_medium:
+            self._next_medium_mono = start + self._medium_poll_interval
+        self._fast_poll_count += 1
+        if self._polling_style in (POLLING_STYLE_AIMD, POLLING_STYLE_MIMD):
+            self._sample_volatility()
+        if run_medium:
             self._medium_poll_count += 1
 
         # Return the current data snapshot so ActiveBluetoothDataUpdateCoordinator
         # retains the populated MarstekData instance.
-        duration = time.monotonic() - start_monotonic
-        self._last_poll_completed_at = time.time()
+        self._last_poll_completed_at = self._now()
+        duration = self._last_poll_completed_at - start
         self._initial_poll_done = True
-        had_failure = any(not c["success"] for c in self._current_poll_commands)
-        self._handle_backoff(had_failure)
-        VERBOSE_LOGGER.debug(
-            "[%s/%s] Poll cycle end in %.3fs (commands=%s)",
-            self.device_name,
-            self.address,
-            duration,
-            [
-                f"0x{c['cmd']:02X}:{'ok' if c['success'] else 'fail'}@{c['duration']:.2f}s"
-                for c in self._current_poll_commands
-            ],
-        )
+        self._drop_unanswered_commands()
+        self._handle_backoff(self._cycle_failures > 0)
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            VERBOSE_LOGGER.debug(
+                "[%s/%s] Poll cycle end in %.3fs (commands=%s)",
+                self.device_name,
+                self.address,
+                duration,
+                [
+                    f"0x{cmd:02X}:{'ok' if ok else 'fail'}@{duration:.2f}s"
+                    for cmd, ok, duration in list(self._poll_command_history)[
+                        len(self._poll_command_history) - self._cycle_commands :
+                    ]
+                ],
+            )
         return self.data
 
+    def _drop_unanswered_commands(self) -> None:
+        """Stop polling medium commands this device has never answered."""
+        if self._cycle_failures >= self._cycle_commands:
+            # Nothing answered this cycle; blame the link, not the commands.
+            return
+        for command, misses in list(self._unanswered_polls.items()):
+            if (
+                misses < UNANSWERED_COMMAND_LIMIT
+                or command in self._answered_commands
+                or command not in self._MEDIUM_COMMAND_IDS
+            ):
+                continue
+            self._medium_commands = tuple(
+                c for c in self._medium_commands if c[0] != command
+            )
+            del self._unanswered_polls[command]
+            self._dropped_commands.append(command)
+            _LOGGER.info(
+                "[%s/%s] Command 0x%02X never answered after %s polls; no longer polling it",
+                self.device_name,
+                self.address,
+                command,
+                misses,
+            )
+
+    def _backoff_resume_at(self) -> float | None:
+        """Return when this device may poll again under the global backoff."""
+        if not _GLOBAL_BACKOFF_UNTIL:
+            return None
+        window = BACKOFF_INTERVALS[_GLOBAL_BACKOFF_LEVEL]
+        # Knuth multiplicative hash of (window, device): a fresh share of the
+        # jitter for every backoff window, stable while that window lasts.
+        seed = int(_GLOBAL_BACKOFF_UNTIL * 1000) ^ self._address_salt
+        stagger = ((seed * 2654435761) & 0xFFFFFFFF) / 2**32
+        return _GLOBAL_BACKOFF_UNTIL + stagger * BACKOFF_JITTER * window
+
     def _handle_backoff(self, had_failure: bool) -> None:
-        """Apply global backoff by pausing all polling for a window."""
-        global _GLOBAL_BACKOFF_LEVEL, _GLOBAL_BACKOFF_UNTIL
+        """Apply global backoff by pausing all polling for a window.
+
+        Any device's failure raises the backoff; only a success from the device
+        that last raised it (or any, once that device is gone) eases it, so a
+        healthy device can't keep resetting the pause a failing one needs.
+        """
+        global _GLOBAL_BACKOFF_LEVEL, _GLOBAL_BACKOFF_UNTIL, _GLOBAL_BACKOFF_OWNER
         if had_failure:
             if _GLOBAL_BACKOFF_LEVEL < len(BACKOFF_INTERVALS) - 1:
                 _GLOBAL_BACKOFF_LEVEL += 1
             backoff_seconds = BACKOFF_INTERVALS[_GLOBAL_BACKOFF_LEVEL]
-            _GLOBAL_BACKOFF_UNTIL = time.time() + backoff_seconds
+            _GLOBAL_BACKOFF_UNTIL = self._now() + backoff_seconds
+            _GLOBAL_BACKOFF_OWNER = self.address
             _LOGGER.warning(
                 "[%s/%s] Entering GLOBAL backoff level %s; pausing all polls for %ss",
                 self.device_name,
@@ -403,105 +896,180 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
                 _GLOBAL_BACKOFF_LEVEL,
                 backoff_seconds,
             )
-        elif _GLOBAL_BACKOFF_LEVEL > 0 or _GLOBAL_BACKOFF_UNTIL:
+        elif (_GLOBAL_BACKOFF_LEVEL > 0 or _GLOBAL_BACKOFF_UNTIL) and (
+            _GLOBAL_BACKOFF_OWNER in (None, self.address)
+        ):
+            # Ease off one level per success so a flapping link escalates again
+            # quickly instead of restarting from the shortest window.
+            _GLOBAL_BACKOFF_LEVEL = max(0, _GLOBAL_BACKOFF_LEVEL - 1)
+            _GLOBAL_BACKOFF_UNTIL = None
+            if not _GLOBAL_BACKOFF_LEVEL:
+                _GLOBAL_BACKOFF_OWNER = None
             _LOGGER.info(
-                "[%s/%s] GLOBAL backoff cleared after successful poll",
+                "[%s/%s] GLOBAL backoff eased to level %s after successful poll",
                 self.device_name,
                 self.address,
+                _GLOBAL_BACKOFF_LEVEL,
             )
-            _GLOBAL_BACKOFF_LEVEL = 0
-            _GLOBAL_BACKOFF_UNTIL = None
 
-    async def _poll_fast(self) -> None:
-        """Poll fast-update data (runtime info, BMS)."""
-        VERBOSE_LOGGER.debug(
-            "[%s/%s] Polling fast data - coordinator.data before: battery_voltage=%s, battery_soc=%s",
-            self.device_name,
-            self.address,
-            self.data.battery_voltage,
-            self.data.battery_soc,
-        )
+    def _due_medium_commands(self) -> list[tuple[int, bytes, float]]:
+        """Return medium-update commands whose adaptive deadline has passed."""
+        if not self._initial_poll_done:
+            return list(self._medium_commands)
+        now = self._now()
+        return [
+            c for c in self._medium_commands if self._next_due.get(c[0], 0.0) <= now
+        ]
+
+    def _observe_medium_reply(self, command: int, payload: bytes | memoryview) -> None:
+        """Update the change model for a medium command and schedule its next poll."""
+        now = self._now()
+        previous_payload = self._last_payloads.get(command)
+        last_change = self._last_change_at.get(command)
+        model = self._change_models.setdefault(command, _ChangeModel())
 
-        # Runtime info - now waits for actual response (Venus Monitor pattern)
-        await self._safe_send_and_sleep(CMD_RUNTIME_INFO, delay=0.1)
+        # Compare against the notification buffer directly; copy only on change.
+        if previous_payload != payload or last_change is None:
+            self._last_payloads[command] = bytes(payload)
+            if previous_payload is not None and last_change is not None:
+                model.add(now - last_change)
+            self._last_change_at[command] = now
+            self._last_poll_offset[command] = 0.0
+            self._next_due.pop(command, None)
+            # Poll again on the regular cadence right after a change.
+            return
 
-        # BMS data - now waits for actual response
-        await self._safe_send_and_sleep(CMD_BMS_DATA, delay=0.1)
+        if not model.ready:
+            return
 
+        bin_width = float(self._medium_poll_interval)
+        current = now - last_change
+        previous = self._last_poll_offset.get(command, 0.0)
+        self._last_poll_offset[command] = current
+        next_offset = model.next_offset(previous, current, bin_width)
+        gap = (
+            next_offset - current
+            if next_offset is not None
+            else float(MAX_MEDIUM_POLL_INTERVAL)
+        )
+        gap = min(max(gap, bin_width), float(MAX_MEDIUM_POLL_INTERVAL))
+        # Half a medium interval of slack so the command joins the medium cycle
+        # closest to its deadline rather than the one after.
+        self._next_due[command] = now + gap - bin_width / 2
         VERBOSE_LOGGER.debug(
-            "[%s/%s] Polling fast data - coordinator.data after: battery_voltage=%s, battery_soc=%s",
+            "[%s/%s] Adaptive schedule for 0x%02X: unchanged for %.0fs, next poll in %.0fs",
             self.device_name,
             self.address,
-            self.data.battery_voltage,
-            self.data.battery_soc,
+            command,
+            current,
+            gap,
         )
 
-    async def _poll_medium(self) -> None:
-        """Poll medium-update data (system, WiFi, config, identity, logs)."""
-        # System data
-        await self._safe_send_and_sleep(CMD_SYSTEM_DATA)
+    async def _run_commands(self, commands: list[tuple[int, bytes, float]]) -> None:
+        """Issue poll commands, pipelining them when the link allows it.
 
-        # WiFi SSID
-        await self._safe_send_and_sleep(CMD_WIFI_SSID)
-
-        # Config data
-        await self._safe_send_and_sleep(CMD_CONFIG_DATA)
-
-        # CT polling rate
-        await self._safe_send_and_sleep(CMD_CT_POLLING_RATE)
-
-        # Meter IP
-        await self._safe_send_and_sleep(CMD_METER_IP, b"\x0B")
-
-        # Network info
-        await self._safe_send_and_sleep(CMD_NETWORK_INFO)
+        Replies are correlated by command byte, so when the write characteristic
+        supports write-without-response up to PIPELINE_DEPTH commands are kept in
+        flight: each reply (or timeout) frees a slot for the next command rather
+        than waiting for a whole batch. Otherwise fall back to one command per
+        round trip. Either way the rest are skipped once POLL_MISS_LIMIT commands
+        in a row went unanswered.
+        """
+        if self.device.supports_pipelining:
+            window = asyncio.Semaphore(PIPELINE_DEPTH)
 
-        # Device info (identity/firmware)
-        await self._safe_send_and_sleep(CMD_DEVICE_INFO)
+            async def _send(cmd: int, payload: bytes) -> None:
+                async with window:
+                    if self._cycle_misses < POLL_MISS_LIMIT:
+                        await self._send_and_await(cmd, payload)
 
-        # Timer info
-        await self._safe_send_and_sleep(CMD_TIMER_INFO)
+            async with asyncio.TaskGroup() as group:
+                for cmd, payload, _ in commands:
+                    group.create_task(_send(cmd, payload))
+            return
 
-        # Logs
-        await self._safe_send_and_sleep(CMD_LOGS)
+        for cmd, payload, delay in commands:
+            if self._cycle_misses >= POLL_MISS_LIMIT:
+                break
+            await self._safe_send_and_sleep(cmd, payload, delay)
 
     def _handle_notification(self, sender: int, data: bytearray) -> None:
         """Handle notification from device."""
-        raw_data = bytes(data)
-        cmd = raw_data[3] if len(raw_data) > 3 else None
-        VERBOSE_LOGGER.debug(
-            "[%s/%s] Received notification cmd=%s from sender %s: %s",
-            self.device_name,
-            self.address,
-            f"0x{cmd:02X}" if cmd is not None else "unknown",
-            sender,
-            raw_data.hex()
-        )
-        VERBOSE_LOGGER.debug(
-            "[%s/%s] Data before parsing: battery_voltage=%s, battery_soc=%s",
-            self.device_name,
-            self.address,
-            self.data.battery_voltage,
-            self.data.battery_soc,
-        )
+        # Copy bleak's buffer once: the parser slices a view of it, field
+        # metadata keeps those slices and history keeps the frame itself.
+        frame = bytes(data)
+        raw_data = memoryview(frame)
+        try:
+            cmd = raw_data[3]
+        except IndexError:
+            cmd = None
+        # Notifications are the hottest path; skip building log arguments unless needed.
+        verbose = VERBOSE_LOGGER.isEnabledFor(logging.DEBUG)
+        if verbose:
+            VERBOSE_LOGGER.debug(
+                "[%s/%s] Received notification cmd=%s from sender %s: %s",
+                self.device_name,
+                self.address,
+                f"0x{cmd:02X}" if cmd is not None else "unknown",
+                sender,
+                raw_data.hex(),
+            )
+            VERBOSE_LOGGER.debug(
+                "[%s/%s] Data before parsing: battery_voltage=%s, battery_soc=%s",
+                self.device_name,
+                self.address,
+                self.data.battery_voltage,
+                self.data.battery_soc,
+            )
 
-        result = self._protocol.parse_notification(raw_data, self.data)
-        self.device.record_notification(sender, raw_data, result)
+        result = self._parse_notification(raw_data, self.data)
+        self.device.record_notification(sender, frame, result)
 
-        VERBOSE_LOGGER.debug(
-            "[%s/%s] Parse result for cmd=%s: %s, data after parsing: battery_voltage=%s, battery_soc=%s",
-            self.device_name,
-            self.address,
-            f"0x{cmd:02X}" if cmd is not None else "unknown",
-            result,
-            self.data.battery_voltage,
-            self.data.battery_soc
-        )
+        if verbose:
+            VERBOSE_LOGGER.debug(
+                "[%s/%s] Parse result for cmd=%s: %s, data after parsing: battery_voltage=%s, battery_soc=%s",
+                self.device_name,
+                self.address,
+                f"0x{cmd:02X}" if cmd is not None else "unknown",
+                result,
+                self.data.battery_voltage,
+                self.data.battery_soc
+            )
+
+        # Any reply completes the matching request, even for commands we don't parse.
+        response = self._pending.pop(cmd, None)
+        if response is not None and not response.done():
+            response.set_result(None)
+
+        if result and cmd in self._MEDIUM_COMMAND_IDS:
+            self._observe_medium_reply(cmd, raw_data[4:-1])
 
         if result:
-            # Entities listen for coordinator updates; notify only when parsing succeeded.
+            # Entities listen for coordinator updates; notify only when parsing
+            # succeeded, and coalesce bursts so a poll fans out once at its end.
+            self._pending_update = True
+            if self._poll_in_flight is None and self._flush_unsub is None:
+                self._flush_unsub = self.hass.loop.call_later(
+                    UPDATE_COALESCE_DELAY, self._flush_updates
+                )
+
+    @callback
+    def _flush_updates(self) -> None:
+        """Notify listeners if notifications changed data since the last flush."""
+        if self._flush_unsub:
+            self._flush_unsub.cancel()
+            self._flush_unsub = None
+        if self._pending_update:
+            self._pending_update = False
             self.async_update_listeners()
 
+    def poll_command_history(self) -> list[dict[str, object]]:
+        """Return recent poll command outcomes for diagnostics."""
+        return [
+            {"cmd": f"0x{cmd:02X}", "success": success, "duration": round(duration, 3)}
+            for cmd, success, duration in self._poll_command_history
+        ]
+
     @property
     def last_update_success(self) -> bool:
         """Return if last update was successful.
@@ -518,6 +1086,13 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         """Handle the device going unavailable."""
         super()._async_handle_unavailable(service_info)
         self._was_unavailable = True
+        self._cached_ble_device = None
+        # The device may come back with new firmware; give dropped medium
+        # commands another chance to answer.
+        self._medium_commands = self._MEDIUM_COMMANDS
+        self._answered_commands.clear()
+        self._unanswered_polls.clear()
+        self._dropped_commands.clear()
         _LOGGER.info("Device %s is unavailable", self.device_name)
 
     @callback
@@ -534,6 +1109,8 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         )
 
         self.ble_device = service_info.device
+        self._cached_ble_device = service_info.device
+        self._cached_ble_device_at = self._now()
 
         # Mark device as ready when we receive advertisements
         if not self._ready_event.is_set():
@@ -548,7 +1125,6 @@ class MarstekDataUpdateCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
 
     async def async_wait_ready(self) -> bool:
         """Wait for the device to be ready."""
-        import contextlib
         try:
             async with asyncio.timeout(30):
                 await self._ready_event.wait()
@@ -2,100 +2,165 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, is_dataclass
-from importlib import resources
+from collections.abc import Collection, Mapping
+from dataclasses import fields, is_dataclass
+from pathlib import Path
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import __version__ as HA_VERSION
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.redact import async_redact_data
+from homeassistant.helpers.redact import REDACTED
 
 from .const import DOMAIN
 from .coordinator import MarstekDataUpdateCoordinator
-
-TO_REDACT = {
-    "wifi_ssid",
-    "wifi_name",
-    "meter_ip",
-    "network_info",
-    "mac_address",
-    "device_id",
-}
+from .marstek_device import MarstekData
+
+TO_REDACT = frozenset(
+    {
+        "wifi_ssid",
+        "wifi_name",
+        "meter_ip",
+        "network_info",
+        "mac_address",
+        "device_id",
+    }
+)
 
 
 def _load_manifest_version() -> str | None:
     """Return the version from manifest.json if available."""
     try:
-        manifest_text = resources.files(__package__).joinpath("manifest.json").read_text(
-            encoding="utf-8"
+        manifest = json.loads(
+            Path(__file__).with_name("manifest.json").read_bytes()
         )
-    except (FileNotFoundError, IsADirectoryError):
-        return None
-    except Exception:
-        return None
-
-    try:
-        manifest = json.loads(manifest_text)
-    except json.JSONDecodeError:
+    except (OSError, ValueError):
         return None
 
     version = manifest.get("version")
     return str(version) if version is not None else None
 
 
+# The manifest can't change while Home Assistant runs; read it once when the
+# platform is imported rather than from the diagnostics coroutine.
+_MANIFEST_VERSION = _load_manifest_version()
+
+
 def _dataclass_to_dict(data: Any) -> Any:
-    """Convert dataclass instances into dictionaries."""
-    if is_dataclass(data):
-        return asdict(data)
+    """Convert dataclass instances into dictionaries.
+
+    Shallow on purpose: async_redact_data rebuilds nested dicts and lists anyway,
+    so asdict's deep copy would only duplicate them twice.
+    """
+    if is_dataclass(data) and not isinstance(data, type):
+        return {field.name: getattr(data, field.name) for field in fields(data)}
+    return data
+
+
+def _field_updates(
+    updates: Mapping[str, tuple[int, float, bytes | memoryview | None]],
+) -> dict[str, dict[str, Any]]:
+    """Expand field update tuples, hex-encoding the payloads."""
+    return {
+        name: {
+            "command": command,
+            "timestamp": timestamp,
+            "payload_hex": payload.hex() if payload else None,
+        }
+        for name, (command, timestamp, payload) in updates.items()
+    }
+
+
+def _redact(data: Any, to_redact: Collection[str]) -> Any:
+    """Mask to_redact keys like async_redact_data, copying only what changes.
+
+    Containers without redactable keys are returned as is, so the large
+    telemetry and history branches aren't rebuilt. Live containers are
+    never modified.
+    """
+    if isinstance(data, Mapping):
+        redacted = None if isinstance(data, dict) else dict(data)
+        for key, value in data.items():
+            if value is None or (isinstance(value, str) and not value):
+                continue
+            if key in to_redact:
+                new_value = REDACTED
+            else:
+                new_value = _redact(value, to_redact)
+                if new_value is value:
+                    continue
+            if redacted is None:
+                redacted = dict(data)
+            redacted[key] = new_value
+        return data if redacted is None else redacted
+
+    if isinstance(data, list):
+        redacted_items = None
+        for index, item in enumerate(data):
+            new_item = _redact(item, to_redact)
+            if new_item is not item:
+                if redacted_items is None:
+                    redacted_items = list(data)
+                redacted_items[index] = new_item
+        return data if redacted_items is None else redacted_items
+
     return data
 
 
 def _coordinator_diagnostics(coordinator: MarstekDataUpdateCoordinator) -> dict[str, Any]:
     """Build a diagnostics snapshot from the coordinator."""
     device_diag = coordinator.device.get_diagnostics()
-    update_interval = (
-        coordinator.update_interval.total_seconds()
-        if coordinator.update_interval
-        else None
-    )
-
-    coordinator_state = {
+    update_interval = coordinator.update_interval
+    ble_device = coordinator.ble_device
+    data = coordinator.data
+    coordinator_data = _dataclass_to_dict(data)
+    if isinstance(data, MarstekData):
+        coordinator_data["field_updates"] = _field_updates(data.field_updates)
+
+    return {
         "device_name": coordinator.device_name,
-        "bluetooth_address": coordinator.ble_device.address if coordinator.ble_device else None,
+        "bluetooth_address": ble_device.address if ble_device else None,
         "ready": coordinator._ready_event.is_set(),  # pylint: disable=protected-access
         "was_unavailable": coordinator._was_unavailable,  # pylint: disable=protected-access
         "last_poll_successful": coordinator.last_poll_successful,
         "polling": {
-            "configured_fast_interval_seconds": coordinator._poll_interval,  # pylint: disable=protected-access
+            "configured_fast_interval_seconds": coordinator._base_poll_interval,  # pylint: disable=protected-access
+            "current_fast_interval_seconds": coordinator._poll_interval,  # pylint: disable=protected-access
+            "polling_style": coordinator._polling_style,  # pylint: disable=protected-access
             "configured_medium_interval_seconds": coordinator._medium_poll_interval,  # pylint: disable=protected-access
-            "active_update_interval_seconds": update_interval,
+            "active_update_interval_seconds": update_interval.total_seconds()
+            if update_interval
+            else None,
             "fast_poll_count": coordinator._fast_poll_count,  # pylint: disable=protected-access
             "medium_poll_count": coordinator._medium_poll_count,  # pylint: disable=protected-access
-            "medium_poll_cycle": coordinator._medium_poll_cycle,  # pylint: disable=protected-access
+            "next_medium_poll_in_seconds": max(
+                0.0,
+                coordinator._next_medium_mono - coordinator.hass.loop.time(),  # pylint: disable=protected-access
+            ),
+            "recent_commands": coordinator.poll_command_history(),
+            "dropped_commands": [
+                f"0x{cmd:02X}" for cmd in coordinator._dropped_commands  # pylint: disable=protected-access
+            ],
         },
         "device_connected": device_diag.get("connected"),
-        "coordinator_data": _dataclass_to_dict(coordinator.data),
+        "coordinator_data": coordinator_data,
         "device_diagnostics": device_diag,
     }
 
-    return coordinator_state
-
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator: MarstekDataUpdateCoordinator | None = entry.runtime_data
-    if coordinator is None:
-        coordinator = (
-            hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("coordinator")
-        )
+    if coordinator is None and (domain_data := hass.data.get(DOMAIN)) is not None:
+        if (entry_data := domain_data.get(entry.entry_id)) is not None:
+            coordinator = entry_data.get("coordinator")
 
     if coordinator is None:
         return {"error": "coordinator_not_available"}
 
-    manifest_version = _load_manifest_version()
+    manifest_version = _MANIFEST_VERSION
 
     diagnostics: dict[str, Any] = {
         "environment": {
@@ -115,4 +180,4 @@ async def async_get_config_entry_diagnostics(
         "coordinator": _coordinator_diagnostics(coordinator),
     }
 
-    return async_redact_data(diagnostics, TO_REDACT)
+    return _redact(diagnostics, TO_REDACT)
@@ -5,14 +5,22 @@ import asyncio
 import logging
 import struct
 import time
-from collections import defaultdict, deque
+from array import array
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Callable
 
 from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
-from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
+from bleak_retry_connector import (
+    BleakClientWithServiceCache,
+    clear_cache,
+    establish_connection,
+)
 
 _LOGGER = logging.getLogger(__name__)
 VERBOSE_LOGGER = logging.getLogger(f"{__name__}.verbose")
@@ -23,12 +31,57 @@ DEVICE_DEBUG = logging.getLogger(f"{__name__}.device")
 DEVICE_DEBUG.propagate = False
 DEVICE_DEBUG.setLevel(logging.INFO)
 
+# Seconds without commands before the link is dropped (unless overridden).
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+# Frame header: start byte, length (including checksum), type and command.
+_FRAME_HEADER = struct.Struct("<BBBB")
+
+# Fixed payload layouts, unpacked in one call per notification.
+# Runtime info (0x03): status flags, output power and temperatures (60+ bytes).
+_RUNTIME_STATUS = struct.Struct("<15xBB3xH6xB4xhh")
+# Runtime info (0x03): power and energy counters (100+ bytes).
+_RUNTIME_ENERGY = struct.Struct("<hhB7xHIIII11xII25xH")
+# System data (0x0D).
+_SYSTEM_DATA = struct.Struct("<B5H")
+# Timer info (0x13): adaptive mode, smart meter flag and adaptive output.
+_TIMER_INFO = struct.Struct("<B36xBH")
+# BMS data (0x14): pack values followed by 16 cell voltages at offset 48.
+_BMS_DATA = struct.Struct("<HHHhHHHHhH6xHII2xH4H16H")
+_CELL_VOLTAGE_FIELDS = tuple(f"cell_{i}_voltage" for i in range(1, 17))
+# Single fields at an offset: unpack_from(payload, offset)[0].
+_U16 = struct.Struct("<H").unpack_from
+_S8 = struct.Struct("<b").unpack_from
+# Device info (0x04): key in the key=value list -> MarstekData field.
+_DEVICE_INFO_KEYS = {
+    b"type": "device_type",
+    b"id": "device_id",
+    b"sn": "serial_number",
+    b"mac": "mac_address",
+    b"dev_ver": "firmware_version",
+    b"fc_ver": "firmware_version",
+    b"fw": "firmware_version",
+    b"hw": "hardware_version",
+}
+
+# Network info (0x24): key in the key:value list -> MarstekData field.
+_NETWORK_INFO_KEYS = {
+    "ip": "ip_address",
+    "gate": "gateway",
+    "gateway": "gateway",
+    "mask": "subnet_mask",
+    "dns": "dns_server",
+}
+
+# "0xNN" label for every command byte, built once for history entries.
+_COMMAND_LABELS = tuple(f"0x{cmd:02X}" for cmd in range(256))
+
 # BLE UUIDs
 CHAR_WRITE_UUID = "0000ff01-0000-1000-8000-00805f9b34fb"
 CHAR_NOTIFY_UUID = "0000ff02-0000-1000-8000-00805f9b34fb"
 
 
-@dataclass
+@dataclass(slots=True)
 class MarstekData:
     """Data from Marstek device."""
 
@@ -120,41 +173,46 @@ class MarstekData:
     # Local API status (0x28)
     local_api_status: str | None = None
 
-    # Internal diagnostics
-    field_updates: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
+    # Internal diagnostics: field -> (command, timestamp, payload). The payload
+    # is kept as received and hex-encoded only when metadata is read.
+    field_updates: dict[str, tuple[int, float, bytes | memoryview | None]] = field(
+        default_factory=dict, repr=False
+    )
 
     def mark_field_update(
         self,
         field: str,
         command: int,
         *,
-        timestamp: float | None = None,
-        payload: bytes | None = None,
+        timestamp: float,
+        payload: bytes | memoryview | None = None,
     ) -> None:
         """Record when a field was last updated and by which command."""
-        ts = timestamp or time.time()
-        self.field_updates[field] = {
-            "command": command,
-            "timestamp": ts,
-            "payload_hex": payload.hex() if payload else None,
-        }
+        self.field_updates[field] = (command, timestamp, payload)
+
+    def oldest_field_age(self, fields: list[str]) -> float | None:
+        """Return the age in seconds of the stalest updated field, if any."""
+        now = time.time()
+        ages = [
+            now - entry[1]
+            for name in fields
+            if (entry := self.field_updates.get(name)) is not None
+        ]
+        return max(ages) if ages else None
 
     def get_field_metadata(self, field: str) -> dict[str, Any] | None:
         """Return metadata for a field including age in seconds."""
         entry = self.field_updates.get(field)
-        if not entry:
+        if entry is None:
             return None
 
-        timestamp = entry.get("timestamp")
-        age = time.time() - timestamp if timestamp else None
+        command, timestamp, payload = entry
         return {
-            "command": entry.get("command"),
-            "command_hex": f"0x{entry['command']:02X}" if entry.get("command") is not None else None,
-            "timestamp": datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
-            if timestamp
-            else None,
-            "age_seconds": age,
-            "payload_hex": entry.get("payload_hex"),
+            "command": command,
+            "command_hex": f"0x{command:02X}",
+            "timestamp": datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
+            "age_seconds": time.time() - timestamp,
+            "payload_hex": payload.hex() if payload else None,
         }
 
 
@@ -167,35 +225,77 @@ class MarstekProtocol:
         field: str,
         command: int,
         timestamp: float,
-        payload: bytes | None = None,
+        payload: bytes | memoryview | None = None,
     ) -> None:
         """Mark a field as updated by a specific command."""
-        device_data.mark_field_update(field, command, timestamp=timestamp, payload=payload)
+        device_data.field_updates[field] = (command, timestamp, payload)
+
+    @staticmethod
+    def _track_fields(
+        device_data: MarstekData,
+        fields: Iterable[str],
+        command: int,
+        timestamp: float,
+        payload: bytes | memoryview | None = None,
+    ) -> None:
+        """Mark several fields as updated by one command, sharing one entry."""
+        device_data.field_updates.update(
+            dict.fromkeys(fields, (command, timestamp, payload))
+        )
 
     @staticmethod
+    def _xor_checksum(data: bytes | bytearray | memoryview) -> int:
+        """XOR all bytes of data.
+
+        Long frames (runtime info, BMS) are XORed eight bytes at a time and the
+        64-bit accumulator folded down to a byte; short frames are cheaper to
+        walk byte by byte.
+        """
+        view = memoryview(data)
+        size = len(view) & ~7 if len(view) >= 64 else 0
+        checksum = 0
+        if size:
+            for word in view[:size].cast("Q"):
+                checksum ^= word
+            checksum ^= checksum >> 32
+            checksum ^= checksum >> 16
+            checksum ^= checksum >> 8
+            checksum &= 0xFF
+        for byte in view[size:]:
+            checksum ^= byte
+        return checksum
+
+    @staticmethod
+    @lru_cache(maxsize=64)
     def build_command(cmd: int, payload: bytes = b"") -> bytes:
         """Build a command frame.
 
         Frame structure: [0x73][len][0x23][cmd][payload...][xor]
-        """
-        frame = bytearray([0x73, 0x00, 0x23, cmd])
-        frame.extend(payload)
-        frame[1] = len(frame) + 1  # Length includes checksum
 
-        # Calculate XOR checksum
-        checksum = 0
-        for byte in frame:
-            checksum ^= byte
-        frame.append(checksum)
+        Polls and entities use a small fixed set of (cmd, payload) pairs, so
+        frames are memoized; ``payload`` must be hashable ``bytes``.
+        """
+        size = len(payload) + 5
+        frame = bytearray(size)
+        _FRAME_HEADER.pack_into(frame, 0, 0x73, size, 0x23, cmd)
+        frame[4:-1] = payload
+        frame[-1] = MarstekProtocol._xor_checksum(memoryview(frame)[:-1])
 
         return bytes(frame)
 
     @staticmethod
-    def parse_notification(data: bytes, device_data: MarstekData) -> bool:
+    def parse_notification(
+        data: bytes | bytearray | memoryview, device_data: MarstekData
+    ) -> bool:
         """Parse notification data and update device_data.
 
+        ``data`` may be any buffer; it is viewed, so payload slices are not copied.
+        Field metadata keeps those slices, so the buffer must not be reused.
+
         Returns True if data was successfully parsed.
         """
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
         if len(data) < 5:
             _LOGGER.warning("Notification too short (%d bytes)", len(data))
             return False
@@ -205,47 +305,32 @@ class MarstekProtocol:
             return False
 
         # Verify XOR checksum
-        expected_checksum = 0
-        for byte in data[:-1]:
-            expected_checksum ^= byte
+        expected_checksum = MarstekProtocol._xor_checksum(data[:-1])
         if data[-1] != expected_checksum:
             _LOGGER.warning("Invalid checksum: expected 0x%02X, got 0x%02X", expected_checksum, data[-1])
             return False
 
         cmd = data[3]
         payload = data[4:-1]  # Exclude header and checksum
-        payload_len = len(payload)
         timestamp = time.time()
 
-        VERBOSE_LOGGER.debug("Parsing cmd 0x%02X, payload length %d", cmd, payload_len)
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            VERBOSE_LOGGER.debug(
+                "Parsing cmd 0x%02X, payload length %d", cmd, len(payload)
+            )
 
-        try:
-            if cmd == 0x03:  # Runtime info
-                return MarstekProtocol._parse_runtime_info(payload, device_data, timestamp)
-            elif cmd == 0x04:  # Device info
-                return MarstekProtocol._parse_device_info(payload, device_data, timestamp)
-            elif cmd == 0x08:  # WiFi SSID
-                return MarstekProtocol._parse_wifi_ssid(payload, device_data, timestamp)
-            elif cmd == 0x0D:  # System data
-                return MarstekProtocol._parse_system_data(payload, device_data, timestamp)
-            elif cmd == 0x13:  # Timer info
-                return MarstekProtocol._parse_timer_info(payload, device_data, timestamp)
-            elif cmd == 0x14:  # BMS data
-                return MarstekProtocol._parse_bms_data(payload, device_data, timestamp)
-            elif cmd == 0x1A:  # Config data
-                return MarstekProtocol._parse_config_data(payload, device_data, timestamp)
-            elif cmd == 0x21:  # Meter IP
-                return MarstekProtocol._parse_meter_ip(payload, device_data, timestamp)
-            elif cmd == 0x22:  # CT polling rate
-                return MarstekProtocol._parse_ct_polling_rate(payload, device_data, timestamp)
-            elif cmd == 0x24:  # Network info
-                return MarstekProtocol._parse_network_info(payload, device_data, timestamp)
-            elif cmd == 0x28:  # Local API status
-                return MarstekProtocol._parse_local_api_status(payload, device_data, timestamp)
-            else:
-                VERBOSE_LOGGER.debug("Unhandled cmd 0x%02X", cmd)
-                return False
+        handler = MarstekProtocol._HANDLERS.get(cmd)
+        if handler is None:
+            VERBOSE_LOGGER.debug("Unhandled cmd 0x%02X", cmd)
+            return False
 
+        # Entering try is free on Python 3.11+. A payload shorter than its
+        # layout is logged without a traceback; anything else is a bug.
+        try:
+            return handler(payload, device_data, timestamp)
+        except (struct.error, IndexError, ValueError) as e:
+            _LOGGER.warning("Malformed cmd 0x%02X payload: %s", cmd, e)
+            return False
         except Exception as e:
             _LOGGER.exception("Error parsing cmd 0x%02X: %s", cmd, e)
             return False
@@ -267,111 +352,129 @@ class MarstekProtocol:
             # Based on observed data, the short format has limited fields
             try:
                 # These offsets are tentative and may need adjustment
+                tracked: list[str] = []
                 if len(payload) >= 16:
                     device_data.wifi_connected = (payload[15] & 0x01) != 0
                     device_data.mqtt_connected = (payload[15] & 0x02) != 0
-                    MarstekProtocol._track_field(
-                        device_data, "wifi_connected", 0x03, timestamp, payload
-                    )
-                    MarstekProtocol._track_field(
-                        device_data, "mqtt_connected", 0x03, timestamp, payload
-                    )
+                    tracked += ("wifi_connected", "mqtt_connected")
                 if len(payload) >= 17:
                     device_data.out1_active = payload[16] != 0
-                    MarstekProtocol._track_field(
-                        device_data, "out1_active", 0x03, timestamp, payload
-                    )
+                    tracked.append("out1_active")
                 if len(payload) >= 22:
-                    device_data.out1_power = float(struct.unpack("<H", payload[20:22])[0])
-                    MarstekProtocol._track_field(
-                        device_data, "out1_power", 0x03, timestamp, payload
-                    )
+                    device_data.out1_power = float(_U16(payload, 20)[0])
+                    tracked.append("out1_power")
                 if len(payload) >= 29:
                     device_data.extern1_connected = payload[28] != 0
-                    MarstekProtocol._track_field(
-                        device_data, "extern1_connected", 0x03, timestamp, payload
-                    )
+                    tracked.append("extern1_connected")
+                MarstekProtocol._track_fields(
+                    device_data, tracked, 0x03, timestamp, payload
+                )
                 return True
             except Exception as e:
                 _LOGGER.warning("Error parsing short runtime info: %s", e)
                 return False
 
         # Long format (60+ bytes) - standard firmware
-        device_data.out1_power = float(struct.unpack("<H", payload[20:22])[0])
-        device_data.temp_low = struct.unpack("<h", payload[33:35])[0] / 10.0
-        device_data.temp_high = struct.unpack("<h", payload[35:37])[0] / 10.0
-        device_data.wifi_connected = (payload[15] & 0x01) != 0
-        device_data.mqtt_connected = (payload[15] & 0x02) != 0
-        device_data.out1_active = payload[16] != 0
-        device_data.extern1_connected = payload[28] != 0
+        # Status at 0x0F, out1 at 0x10, power at 0x14, extern1 at 0x1C,
+        # temperatures at 0x21/0x23 (÷10)
+        status, out1, out1_power, extern1, temp_low, temp_high = (
+            _RUNTIME_STATUS.unpack_from(payload)
+        )
+        device_data.out1_power = float(out1_power)
+        device_data.temp_low = temp_low / 10.0
+        device_data.temp_high = temp_high / 10.0
+        device_data.wifi_connected = (status & 0x01) != 0
+        device_data.mqtt_connected = (status & 0x02) != 0
+        device_data.out1_active = out1 != 0
+        device_data.extern1_connected = extern1 != 0
 
         # Parse additional fields if payload is long enough (100+ bytes)
         if len(payload) >= 100:
+            (
+                grid_power,
+                solar_power,
+                work_mode,
+                product_code,
+                daily_charged,
+                monthly_charged,
+                daily_discharged,
+                monthly_discharged,
+                total_charged,
+                total_discharged,
+                power_rating,
+            ) = _RUNTIME_ENERGY.unpack_from(payload)
             # Grid/backup power (signed) at offset 0x00
-            device_data.grid_power = float(struct.unpack("<h", payload[0:2])[0])
+            device_data.grid_power = float(grid_power)
             # Solar/battery power (signed) at offset 0x02
-            device_data.solar_power = float(struct.unpack("<h", payload[2:4])[0])
+            device_data.solar_power = float(solar_power)
             # Work mode at offset 0x04
-            device_data.work_mode = int(payload[4])
+            device_data.work_mode = work_mode
             # Product code at offset 0x0C
-            device_data.product_code = int(struct.unpack("<H", payload[12:14])[0])
+            device_data.product_code = product_code
             # Daily charge at offset 0x0E (÷100 for kWh)
-            device_data.daily_energy_charged = struct.unpack("<I", payload[14:18])[0] / 100.0
+            device_data.daily_energy_charged = daily_charged / 100.0
             # Monthly charge at offset 0x12 (÷1000 for kWh)
-            device_data.monthly_energy_charged = struct.unpack("<I", payload[18:22])[0] / 1000.0
+            device_data.monthly_energy_charged = monthly_charged / 1000.0
             # Daily discharge at offset 0x16 (÷100 for kWh)
-            device_data.daily_energy_discharged = struct.unpack("<I", payload[22:26])[0] / 100.0
+            device_data.daily_energy_discharged = daily_discharged / 100.0
             # Monthly discharge at offset 0x1A (÷100 for kWh)
-            device_data.monthly_energy_discharged = struct.unpack("<I", payload[26:30])[0] / 100.0
+            device_data.monthly_energy_discharged = monthly_discharged / 100.0
             # Total charge at offset 0x29 (÷100 for kWh)
-            device_data.total_energy_charged = struct.unpack("<I", payload[41:45])[0] / 100.0
+            device_data.total_energy_charged = total_charged / 100.0
             # Total discharge at offset 0x2D (÷100 for kWh)
-            device_data.total_energy_discharged = struct.unpack("<I", payload[45:49])[0] / 100.0
+            device_data.total_energy_discharged = total_discharged / 100.0
             # Power rating at offset 0x4A
-            device_data.power_rating = int(struct.unpack("<H", payload[74:76])[0])
-
-            for field in (
-                "grid_power",
-                "solar_power",
-                "work_mode",
-                "product_code",
-                "daily_energy_charged",
-                "monthly_energy_charged",
-                "daily_energy_discharged",
-                "monthly_energy_discharged",
-                "total_energy_charged",
-                "total_energy_discharged",
-                "power_rating",
-            ):
-                MarstekProtocol._track_field(
-                    device_data, field, 0x03, timestamp, payload
-                )
-
-        for field in (
-            "out1_power",
-            "temp_low",
-            "temp_high",
-            "wifi_connected",
-            "mqtt_connected",
-            "out1_active",
-            "extern1_connected",
-        ):
-            MarstekProtocol._track_field(
-                device_data, field, 0x03, timestamp, payload
+            device_data.power_rating = power_rating
+
+            MarstekProtocol._track_fields(
+                device_data,
+                (
+                    "grid_power",
+                    "solar_power",
+                    "work_mode",
+                    "product_code",
+                    "daily_energy_charged",
+                    "monthly_energy_charged",
+                    "daily_energy_discharged",
+                    "monthly_energy_discharged",
+                    "total_energy_charged",
+                    "total_energy_discharged",
+                    "power_rating",
+                ),
+                0x03,
+                timestamp,
+                payload,
             )
 
-        VERBOSE_LOGGER.debug(
-            "Runtime data parsed (cmd=0x03): power=%sW wifi=%s mqtt=%s out1_active=%s temp_low/high=%s/%s grid=%sW solar=%sW",
-            device_data.out1_power,
-            device_data.wifi_connected,
-            device_data.mqtt_connected,
-            device_data.out1_active,
-            device_data.temp_low,
-            device_data.temp_high,
-            device_data.grid_power,
-            device_data.solar_power,
+        MarstekProtocol._track_fields(
+            device_data,
+            (
+                "out1_power",
+                "temp_low",
+                "temp_high",
+                "wifi_connected",
+                "mqtt_connected",
+                "out1_active",
+                "extern1_connected",
+            ),
+            0x03,
+            timestamp,
+            payload,
         )
 
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            VERBOSE_LOGGER.debug(
+                "Runtime data parsed (cmd=0x03): power=%sW wifi=%s mqtt=%s out1_active=%s temp_low/high=%s/%s grid=%sW solar=%sW",
+                device_data.out1_power,
+                device_data.wifi_connected,
+                device_data.mqtt_connected,
+                device_data.out1_active,
+                device_data.temp_low,
+                device_data.temp_high,
+                device_data.grid_power,
+                device_data.solar_power,
+            )
+
         return True
 
     @staticmethod
@@ -380,35 +483,35 @@ class MarstekProtocol:
     ) -> bool:
         """Parse device info (0x04) - ASCII key=value pairs."""
         try:
-            info_str = payload.decode("ascii", errors="ignore")
-            pairs = info_str.split(",")
-
-            for pair in pairs:
-                if "=" not in pair:
+            # Split on bytes and decode only the values of known keys.
+            for pair in bytes(payload).split(b","):
+                key, sep, value = pair.partition(b"=")
+                if not sep:
                     continue
+                field = _DEVICE_INFO_KEYS.get(key.strip())
+                if field is not None:
+                    setattr(
+                        device_data, field, str(value.strip(), "ascii", "ignore")
+                    )
 
-                key, value = pair.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                if key == "type":
-                    device_data.device_type = value
-                elif key == "id":
-                    device_data.device_id = value
-                elif key == "sn":
-                    device_data.serial_number = value
-                elif key == "mac":
-                    device_data.mac_address = value
-                elif key in ("dev_ver", "fc_ver", "fw"):
-                    device_data.firmware_version = value
-                elif key == "hw":
-                    device_data.hardware_version = value
-
-            for field in ("device_type", "device_id", "serial_number", "mac_address", "firmware_version", "hardware_version"):
-                if getattr(device_data, field) is not None:
-                    MarstekProtocol._track_field(
-                        device_data, field, 0x04, timestamp, payload
+            MarstekProtocol._track_fields(
+                device_data,
+                [
+                    field
+                    for field in (
+                        "device_type",
+                        "device_id",
+                        "serial_number",
+                        "mac_address",
+                        "firmware_version",
+                        "hardware_version",
                     )
+                    if getattr(device_data, field) is not None
+                ],
+                0x04,
+                timestamp,
+                payload,
+            )
 
             return True
         except Exception as e:
@@ -421,7 +524,7 @@ class MarstekProtocol:
     ) -> bool:
         """Parse WiFi SSID (0x08)."""
         try:
-            device_data.wifi_ssid = payload.decode("ascii", errors="ignore").strip()
+            device_data.wifi_ssid = str(payload, "ascii", "ignore").strip()
             MarstekProtocol._track_field(
                 device_data, "wifi_ssid", 0x08, timestamp, payload
             )
@@ -437,24 +540,29 @@ class MarstekProtocol:
         if len(payload) < 11:
             return False
 
-        device_data.system_status = payload[0]
-        device_data.system_value_1 = struct.unpack("<H", payload[1:3])[0]
-        device_data.system_value_2 = struct.unpack("<H", payload[3:5])[0]
-        device_data.system_value_3 = struct.unpack("<H", payload[5:7])[0]
-        device_data.system_value_4 = struct.unpack("<H", payload[7:9])[0]
-        device_data.system_value_5 = struct.unpack("<H", payload[9:11])[0]
-
-        for field in (
-            "system_status",
-            "system_value_1",
-            "system_value_2",
-            "system_value_3",
-            "system_value_4",
-            "system_value_5",
-        ):
-            MarstekProtocol._track_field(
-                device_data, field, 0x0D, timestamp, payload
-            )
+        (
+            device_data.system_status,
+            device_data.system_value_1,
+            device_data.system_value_2,
+            device_data.system_value_3,
+            device_data.system_value_4,
+            device_data.system_value_5,
+        ) = _SYSTEM_DATA.unpack_from(payload)
+
+        MarstekProtocol._track_fields(
+            device_data,
+            (
+                "system_status",
+                "system_value_1",
+                "system_value_2",
+                "system_value_3",
+                "system_value_4",
+                "system_value_5",
+            ),
+            0x0D,
+            timestamp,
+            payload,
+        )
 
         return True
 
@@ -466,18 +574,22 @@ class MarstekProtocol:
         if len(payload) < 45:
             return False
 
-        device_data.adaptive_mode_enabled = payload[0] != 0
-        device_data.smart_meter_connected = payload[37] != 0
-        device_data.adaptive_power_out = float(struct.unpack("<H", payload[38:40])[0])
-
-        for field in (
-            "adaptive_mode_enabled",
-            "smart_meter_connected",
-            "adaptive_power_out",
-        ):
-            MarstekProtocol._track_field(
-                device_data, field, 0x13, timestamp, payload
-            )
+        adaptive, smart_meter, adaptive_power = _TIMER_INFO.unpack_from(payload)
+        device_data.adaptive_mode_enabled = adaptive != 0
+        device_data.smart_meter_connected = smart_meter != 0
+        device_data.adaptive_power_out = float(adaptive_power)
+
+        MarstekProtocol._track_fields(
+            device_data,
+            (
+                "adaptive_mode_enabled",
+                "smart_meter_connected",
+                "adaptive_power_out",
+            ),
+            0x13,
+            timestamp,
+            payload,
+        )
 
         return True
 
@@ -489,84 +601,94 @@ class MarstekProtocol:
         if len(payload) < 80:
             return False
 
+        values = _BMS_DATA.unpack_from(payload)
         # Parse BMS version
-        device_data.bms_version = int(struct.unpack("<H", payload[0:2])[0])
+        device_data.bms_version = values[0]
         # Parse voltage and current limits
-        device_data.voltage_limit = struct.unpack("<H", payload[2:4])[0] / 10.0
-        device_data.charge_current_limit = struct.unpack("<H", payload[4:6])[0] / 10.0
-        device_data.discharge_current_limit = struct.unpack("<h", payload[6:8])[0] / 10.0
+        device_data.voltage_limit = values[1] / 10.0
+        device_data.charge_current_limit = values[2] / 10.0
+        device_data.discharge_current_limit = values[3] / 10.0
         # Parse SOC, SOH, capacity
-        device_data.battery_soc = float(struct.unpack("<H", payload[8:10])[0])
-        device_data.battery_soh = float(struct.unpack("<H", payload[10:12])[0])
-        device_data.design_capacity = float(struct.unpack("<H", payload[12:14])[0])
+        device_data.battery_soc = float(values[4])
+        device_data.battery_soh = float(values[5])
+        device_data.design_capacity = float(values[6])
         # Parse voltage, current, temperature
-        device_data.battery_voltage = struct.unpack("<H", payload[14:16])[0] / 100.0
-        device_data.battery_current = struct.unpack("<h", payload[16:18])[0] / 10.0
-        device_data.battery_temp = float(struct.unpack("<H", payload[18:20])[0])
+        device_data.battery_voltage = values[7] / 100.0
+        device_data.battery_current = values[8] / 10.0
+        device_data.battery_temp = float(values[9])
         # Parse error and warning codes
-        device_data.error_code = int(struct.unpack("<H", payload[26:28])[0])
-        device_data.warning_code = int(struct.unpack("<I", payload[28:32])[0])
+        device_data.error_code = values[10]
+        device_data.warning_code = values[11]
         # Parse runtime (convert from ms to hours)
-        runtime_ms = struct.unpack("<I", payload[32:36])[0]
-        device_data.runtime_hours = runtime_ms / 3600000.0
+        device_data.runtime_hours = values[12] / 3600000.0
         # Parse MOSFET temperature
-        device_data.mosfet_temp = float(struct.unpack("<H", payload[38:40])[0])
+        device_data.mosfet_temp = float(values[13])
         # Parse temperature sensors 1-4
-        device_data.temp_sensor_1 = float(struct.unpack("<H", payload[40:42])[0])
-        device_data.temp_sensor_2 = float(struct.unpack("<H", payload[42:44])[0])
-        device_data.temp_sensor_3 = float(struct.unpack("<H", payload[44:46])[0])
-        device_data.temp_sensor_4 = float(struct.unpack("<H", payload[46:48])[0])
+        device_data.temp_sensor_1 = float(values[14])
+        device_data.temp_sensor_2 = float(values[15])
+        device_data.temp_sensor_3 = float(values[16])
+        device_data.temp_sensor_4 = float(values[17])
 
         # Parse cell voltages (16 cells starting at offset 48)
-        for i in range(16):
-            offset = 48 + i * 2
-            if offset + 1 < len(payload):
-                cell_voltage = struct.unpack("<H", payload[offset:offset + 2])[0] / 1000.0
-                device_data.cell_voltages[i] = cell_voltage
-                MarstekProtocol._track_field(
-                    device_data, f"cell_{i + 1}_voltage", 0x14, timestamp, payload
-                )
-
-        for field in (
-            "bms_version",
-            "voltage_limit",
-            "charge_current_limit",
-            "discharge_current_limit",
-            "battery_soc",
-            "battery_soh",
-            "design_capacity",
-            "battery_voltage",
-            "battery_current",
-            "battery_temp",
-            "error_code",
-            "warning_code",
-            "runtime_hours",
-            "mosfet_temp",
-            "temp_sensor_1",
-            "temp_sensor_2",
-            "temp_sensor_3",
-            "temp_sensor_4",
-        ):
-            MarstekProtocol._track_field(
-                device_data, field, 0x14, timestamp, payload
-            )
+        device_data.cell_voltages = [raw / 1000.0 for raw in values[18:]]
+        MarstekProtocol._track_fields(
+            device_data, _CELL_VOLTAGE_FIELDS, 0x14, timestamp, payload
+        )
 
-        cells = [v for v in device_data.cell_voltages if v is not None]
-        cell_min = min(cells) if cells else None
-        cell_max = max(cells) if cells else None
-        cell_avg = sum(cells) / len(cells) if cells else None
-        VERBOSE_LOGGER.debug(
-            "BMS parsed (cmd=0x14): V=%sV I=%sA SOC=%s%% SOH=%s%% cells(min/max/avg)=%s/%s/%s runtime=%sh",
-            device_data.battery_voltage,
-            device_data.battery_current,
-            device_data.battery_soc,
-            device_data.battery_soh,
-            cell_min,
-            cell_max,
-            cell_avg,
-            device_data.runtime_hours,
+        MarstekProtocol._track_fields(
+            device_data,
+            (
+                "bms_version",
+                "voltage_limit",
+                "charge_current_limit",
+                "discharge_current_limit",
+                "battery_soc",
+                "battery_soh",
+                "design_capacity",
+                "battery_voltage",
+                "battery_current",
+                "battery_temp",
+                "error_code",
+                "warning_code",
+                "runtime_hours",
+                "mosfet_temp",
+                "temp_sensor_1",
+                "temp_sensor_2",
+                "temp_sensor_3",
+                "temp_sensor_4",
+            ),
+            0x14,
+            timestamp,
+            payload,
         )
 
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            cell_min = cell_max = cell_avg = None
+            cell_sum = 0.0
+            cell_count = 0
+            for voltage in device_data.cell_voltages:
+                if voltage is None:
+                    continue
+                if cell_count == 0 or voltage < cell_min:
+                    cell_min = voltage
+                if cell_count == 0 or voltage > cell_max:
+                    cell_max = voltage
+                cell_sum += voltage
+                cell_count += 1
+            if cell_count:
+                cell_avg = cell_sum / cell_count
+            VERBOSE_LOGGER.debug(
+                "BMS parsed (cmd=0x14): V=%sV I=%sA SOC=%s%% SOH=%s%% cells(min/max/avg)=%s/%s/%s runtime=%sh",
+                device_data.battery_voltage,
+                device_data.battery_current,
+                device_data.battery_soc,
+                device_data.battery_soh,
+                cell_min,
+                cell_max,
+                cell_avg,
+                device_data.runtime_hours,
+            )
+
         return True
 
     @staticmethod
@@ -578,13 +700,16 @@ class MarstekProtocol:
             return False
 
         device_data.config_mode = payload[0]
-        device_data.config_status = struct.unpack("<b", payload[4:5])[0]
+        device_data.config_status = _S8(payload, 4)[0]
         device_data.config_value = payload[16]
 
-        for field in ("config_mode", "config_status", "config_value"):
-            MarstekProtocol._track_field(
-                device_data, field, 0x1A, timestamp, payload
-            )
+        MarstekProtocol._track_fields(
+            device_data,
+            ("config_mode", "config_status", "config_value"),
+            0x1A,
+            timestamp,
+            payload,
+        )
 
         return True
 
@@ -595,10 +720,10 @@ class MarstekProtocol:
         """Parse meter IP (0x21)."""
         try:
             # Check if all 0xFF (not set)
-            if all(b == 0xFF for b in payload):
+            if payload == b"\xff" * len(payload):
                 device_data.meter_ip = "(not set)"
             else:
-                device_data.meter_ip = payload.decode("ascii", errors="ignore").strip("\x00")
+                device_data.meter_ip = str(payload, "ascii", "ignore").strip("\x00")
 
             MarstekProtocol._track_field(
                 device_data, "meter_ip", 0x21, timestamp, payload
@@ -631,34 +756,37 @@ class MarstekProtocol:
         Format: "ip:192.168.20.82,gate:192.168.20.1,mask:255.255.255.0,dns:192.168.20.1"
         """
         try:
-            network_str = payload.decode("ascii", errors="ignore").strip()
+            network_str = str(payload, "ascii", "ignore").strip()
             device_data.network_info = network_str
 
-            # Parse individual fields from comma-delimited string
+            # The whole string is kept as network_info, so split the decoded
+            # text rather than the bytes.
             if network_str:
-                pairs = network_str.split(",")
-                for pair in pairs:
-                    if ":" not in pair:
+                for pair in network_str.split(","):
+                    key, sep, value = pair.partition(":")
+                    if not sep:
                         continue
-
-                    key, value = pair.split(":", 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    if key == "ip":
-                        device_data.ip_address = value
-                    elif key in ("gate", "gateway"):
-                        device_data.gateway = value
-                    elif key == "mask":
-                        device_data.subnet_mask = value
-                    elif key == "dns":
-                        device_data.dns_server = value
-
-            for field in ("network_info", "ip_address", "gateway", "subnet_mask", "dns_server"):
-                if getattr(device_data, field) is not None:
-                    MarstekProtocol._track_field(
-                        device_data, field, 0x24, timestamp, payload
+                    field = _NETWORK_INFO_KEYS.get(key.strip())
+                    if field is not None:
+                        setattr(device_data, field, value.strip())
+
+            MarstekProtocol._track_fields(
+                device_data,
+                [
+                    field
+                    for field in (
+                        "network_info",
+                        "ip_address",
+                        "gateway",
+                        "subnet_mask",
+                        "dns_server",
                     )
+                    if getattr(device_data, field) is not None
+                ],
+                0x24,
+                timestamp,
+                payload,
+            )
 
             return True
         except Exception:
@@ -673,7 +801,7 @@ class MarstekProtocol:
             return False
 
         enabled = "enabled" if payload[0] == 1 else "disabled"
-        port = struct.unpack("<H", payload[1:3])[0]
+        port = _U16(payload, 1)[0]
         device_data.local_api_status = f"{enabled}/{port}"
 
         MarstekProtocol._track_field(
@@ -682,6 +810,33 @@ class MarstekProtocol:
 
         return True
 
+    # Parser per command byte (staticmethod objects are callable).
+    _HANDLERS: dict[int, Callable[..., bool]] = {
+        0x03: _parse_runtime_info,  # Runtime info
+        0x04: _parse_device_info,  # Device info
+        0x08: _parse_wifi_ssid,  # WiFi SSID
+        0x0D: _parse_system_data,  # System data
+        0x13: _parse_timer_info,  # Timer info
+        0x14: _parse_bms_data,  # BMS data
+        0x1A: _parse_config_data,  # Config data
+        0x21: _parse_meter_ip,  # Meter IP
+        0x22: _parse_ct_polling_rate,  # CT polling rate
+        0x24: _parse_network_info,  # Network info
+        0x28: _parse_local_api_status,  # Local API status
+    }
+
+
+@dataclass(slots=True)
+class _CommandStats:
+    """Send outcomes for one command byte."""
+
+    sent: int = 0
+    success: int = 0
+    failure: int = 0
+    last_success: float | None = None
+    last_failure: float | None = None
+    last_error: str | None = None
+
 
 class MarstekBLEDevice:
     """Manages BLE connection and commands for Marstek device.
@@ -708,6 +863,9 @@ class MarstekBLEDevice:
             notification_callback: Callback for handling BLE notifications
         """
         self._ble_device = ble_device
+        # Set once the services cache was cleared for the current run of failed
+        # connects; reset by the next successful one.
+        self._services_cache_cleared = False
         self._device_name = device_name
         self._ble_device_callback = ble_device_callback
         self._notification_callback = notification_callback
@@ -715,22 +873,28 @@ class MarstekBLEDevice:
         self._connect_lock = asyncio.Lock()
         self._operation_lock = asyncio.Lock()
         self._disconnect_timer: asyncio.TimerHandle | None = None
+        # Loop time of the idle disconnect; the timer re-arms itself until then.
+        self._disconnect_at = 0.0
+        self._idle_timeout = DEFAULT_IDLE_TIMEOUT
+        # Open connected() sessions; the idle disconnect is suspended while > 0.
+        self._sessions = 0
         self._expected_disconnect = False
         self._notifications_started = False
-        self._command_history: deque[dict[str, Any]] = deque(maxlen=25)
-        self._notification_history: deque[dict[str, Any]] = deque(maxlen=25)
-        self._command_stats: defaultdict[int, dict[str, Any]] = defaultdict(
-            lambda: {
-                "sent": 0,
-                "success": 0,
-                "failure": 0,
-                "last_success": None,
-                "last_failure": None,
-                "last_error": None,
-                "last_notification": None,
-                "last_notification_hex": None,
-            }
-        )
+        # Raw (timestamp, cmd, frame, attempts, success, error) and
+        # (timestamp, sender, cmd, frame, parsed) tuples; get_diagnostics
+        # turns them into dicts.
+        self._command_history: deque[
+            tuple[float, int, bytes, int, bool, str | None]
+        ] = deque(maxlen=25)
+        self._notification_history: deque[
+            tuple[float, Any, int | None, bytes, bool]
+        ] = deque(maxlen=25)
+        # Per-command send outcomes, indexed by command byte like the tables below.
+        self._command_stats: list[_CommandStats | None] = [None] * 256
+        # Latest notification per command byte, in flat 256-slot tables so the
+        # notification path is two indexed stores and memory stays bounded.
+        self._last_notification_at = array("d", [0.0]) * 256
+        self._last_notification_frame: list[bytes | None] = [None] * 256
         self._total_commands_sent = 0
         self._total_commands_success = 0
         self._total_commands_failure = 0
@@ -751,6 +915,29 @@ class MarstekBLEDevice:
         """Return the device address."""
         return self._ble_device.address
 
+    def set_idle_timeout(self, seconds: float) -> None:
+        """Set how long the link stays up without commands before disconnecting."""
+        self._idle_timeout = seconds
+
+    @asynccontextmanager
+    async def connected(self) -> AsyncIterator[None]:
+        """Hold one connection open across a batch of commands.
+
+        Connects on entry (raising BleakError/TimeoutError on failure) and
+        suspends the idle disconnect until the last session exits, so the
+        commands inside share the link without re-arming the timer per write.
+        """
+        await self._ensure_connected()
+        self._sessions += 1
+        if self._disconnect_timer:
+            self._disconnect_timer.cancel()
+            self._disconnect_timer = None
+        try:
+            yield
+        finally:
+            self._sessions -= 1
+            self._reset_disconnect_timer()
+
     async def _ensure_connected(self) -> None:
         """Ensure we have an active BLE connection."""
         if self._client and self._client.is_connected:
@@ -787,10 +974,13 @@ class MarstekBLEDevice:
                     self._ble_device,
                     self._device_name,
                     disconnected_callback=self._on_disconnect,
+                    # The library default, spelled out: reconnects reuse the
+                    # resolved GATT services instead of rediscovering them.
                     use_services_cache=True,
                     ble_device_callback=self._ble_device_callback,
                 )
                 _LOGGER.debug("%s: Connected successfully", self._device_name)
+                self._services_cache_cleared = False
 
                 # Start notifications if callback provided
                 if self._notification_callback and not self._notifications_started:
@@ -812,6 +1002,12 @@ class MarstekBLEDevice:
                 _LOGGER.warning(
                     "%s: Failed to connect: %s", self._device_name, ex
                 )
+                # Connected but notify setup failed: the cached services may be
+                # stale. Drop the half-open link before touching the cache.
+                if self._client is not None and self._client.is_connected:
+                    await self._drop_client()
+                self._client = None
+                await self._clear_services_cache()
                 raise
 
     def _on_disconnect(self, client: BleakClientWithServiceCache) -> None:
@@ -825,20 +1021,47 @@ class MarstekBLEDevice:
         self._notifications_started = False
 
     def _reset_disconnect_timer(self) -> None:
-        """Reset the disconnect timer."""
-        if self._disconnect_timer:
-            self._disconnect_timer.cancel()
+        """Reset the disconnect timer.
 
-        # Disconnect after 30 seconds of inactivity
-        loop = asyncio.get_event_loop()
-        self._disconnect_timer = loop.call_later(
-            30.0, lambda: asyncio.create_task(self._execute_disconnect())
-        )
-        VERBOSE_LOGGER.debug(
-            "%s: Scheduled inactivity disconnect in 30s (last_command_age=%.1fs)",
-            self._device_name,
-            time.time() - self._last_command_time if self._last_command_time else -1,
-        )
+        Only the deadline moves; a pending timer is kept and re-arms itself
+        when it fires early, so each command doesn't allocate a new handle.
+        """
+        if self._sessions:
+            if self._disconnect_timer:
+                self._disconnect_timer.cancel()
+                self._disconnect_timer = None
+            return
+
+        # Disconnect after the idle timeout without commands
+        loop = asyncio.get_running_loop()
+        self._disconnect_at = loop.time() + self._idle_timeout
+        timer = self._disconnect_timer
+        if timer is not None and timer.when() > self._disconnect_at:
+            # The idle timeout was shortened; a pending timer would fire late.
+            timer.cancel()
+            timer = None
+        if timer is None:
+            self._disconnect_timer = loop.call_at(
+                self._disconnect_at, self._on_disconnect_timer
+            )
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            VERBOSE_LOGGER.debug(
+                "%s: Scheduled inactivity disconnect in %.0fs (last_command_age=%.1fs)",
+                self._device_name,
+                self._idle_timeout,
+                time.time() - self._last_command_time if self._last_command_time else -1,
+            )
+
+    def _on_disconnect_timer(self) -> None:
+        """Disconnect once the idle deadline has passed, else re-arm."""
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._disconnect_at:
+            self._disconnect_timer = loop.call_at(
+                self._disconnect_at, self._on_disconnect_timer
+            )
+            return
+        self._disconnect_timer = None
+        asyncio.create_task(self._execute_disconnect())
 
     async def _execute_disconnect(self) -> None:
         """Execute disconnection."""
@@ -856,7 +1079,62 @@ class MarstekBLEDevice:
                 )
                 self._expected_disconnect = True
                 await self._client.disconnect()
-            self._disconnect_timer = None
+
+    async def _drop_client(self) -> None:
+        """Disconnect the current client so the next command reconnects."""
+        if self._client:
+            self._expected_disconnect = True
+            try:
+                await self._client.disconnect()
+            except Exception:
+                pass
+            self._client = None
+
+    @property
+    def supports_pipelining(self) -> bool:
+        """Return whether commands can be written without awaiting each reply."""
+        if not self.is_connected:
+            return False
+        char = self._client.services.get_characteristic(CHAR_WRITE_UUID)
+        return char is not None and "write-without-response" in char.properties
+
+    async def write_command(self, cmd: int, payload: bytes = b"") -> bytes:
+        """Write one command without waiting for the device's reply.
+
+        The reply is delivered through the notification callback, where the
+        caller correlates it by command byte, so several writes can be in
+        flight at once. Falls back to an acknowledged write when the
+        characteristic lacks write-without-response. Returns the frame written.
+        """
+        frame = MarstekProtocol.build_command(cmd, payload)
+        async with self._operation_lock:
+            try:
+                await self._ensure_connected()
+                await self._client.write_gatt_char(
+                    CHAR_WRITE_UUID, frame, response=not self.supports_pipelining
+                )
+            except (BleakError, TimeoutError) as ex:
+                _LOGGER.warning(
+                    "%s: Failed to write command 0x%02X: %s",
+                    self._device_name,
+                    cmd,
+                    ex,
+                )
+                await self._drop_client()
+                raise
+
+        self._last_command_time = time.time()
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            VERBOSE_LOGGER.debug(
+                "%s TX (addr=%s handle=%s) cmd=0x%02X payload=%s (pipelined)",
+                self._device_name,
+                self.address,
+                CHAR_WRITE_UUID,
+                cmd,
+                payload.hex(),
+            )
+        self._reset_disconnect_timer()
+        return frame
 
     async def send_command(
         self, cmd: int, payload: bytes = b"", retry: int = 3
@@ -899,14 +1177,15 @@ class MarstekBLEDevice:
 
                     await self._client.write_gatt_char(CHAR_WRITE_UUID, command_data)
                     self._last_command_time = wall_time
-                    VERBOSE_LOGGER.debug(
-                        "%s TX (addr=%s handle=%s) cmd=0x%02X payload=%s",
-                        self._device_name,
-                        self.address,
-                        CHAR_WRITE_UUID,
-                        cmd,
-                        payload.hex(),
-                    )
+                    if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+                        VERBOSE_LOGGER.debug(
+                            "%s TX (addr=%s handle=%s) cmd=0x%02X payload=%s",
+                            self._device_name,
+                            self.address,
+                            CHAR_WRITE_UUID,
+                            cmd,
+                            payload.hex(),
+                        )
 
                     self._reset_disconnect_timer()
 
@@ -931,7 +1210,7 @@ class MarstekBLEDevice:
                         self._response_event = None
 
                     duration = time.monotonic() - start_time
-                    self._record_command_result(
+                    self.record_command_result(
                         cmd=cmd,
                         frame=command_data,
                         attempts=attempts_made,
@@ -961,13 +1240,7 @@ class MarstekBLEDevice:
                         ex,
                     )
                     # Force reconnect on next attempt
-                    if self._client:
-                        self._expected_disconnect = True
-                        try:
-                            await self._client.disconnect()
-                        except Exception:
-                            pass
-                        self._client = None
+                    await self._drop_client()
 
                     if attempt < retry - 1:
                         await asyncio.sleep(0.5)
@@ -978,7 +1251,7 @@ class MarstekBLEDevice:
                 cmd,
                 retry,
             )
-            self._record_command_result(
+            self.record_command_result(
                 cmd=cmd,
                 frame=command_data,
                 attempts=attempts_made,
@@ -987,6 +1260,18 @@ class MarstekBLEDevice:
             )
             return False
 
+    async def _clear_services_cache(self) -> None:
+        """Forget cached GATT services after a failed connect.
+
+        On BlueZ this also removes the device from the adapter, so it is done
+        at most once per run of failures and never while a client is live.
+        """
+        if self._services_cache_cleared or self._client is not None:
+            return
+        self._services_cache_cleared = True
+        if await clear_cache(self.address):
+            _LOGGER.debug("%s: Cleared cached GATT services", self._device_name)
+
     async def disconnect(self) -> None:
         """Disconnect from the device."""
         if self._disconnect_timer:
@@ -1015,7 +1300,7 @@ class MarstekBLEDevice:
         """Return whether the BLE client is currently connected."""
         return bool(self._client and self._client.is_connected)
 
-    def _record_command_result(
+    def record_command_result(
         self,
         *,
         cmd: int,
@@ -1026,132 +1311,155 @@ class MarstekBLEDevice:
     ) -> None:
         """Record diagnostic information about a command."""
         timestamp = time.time()
-        payload = frame[4:-1] if len(frame) > 5 else b""
 
         self._command_history.append(
-            {
-                "timestamp": timestamp,
-                "command": f"0x{cmd:02X}",
-                "payload_hex": payload.hex(),
-                "frame_hex": frame.hex(),
-                "attempts": attempts,
-                "success": success,
-                "error": error,
-                "response": "received" if success else "no_response" if error == "no_response" else "error",
-            }
+            (timestamp, cmd, frame, attempts, success, error)
         )
 
         stats = self._command_stats[cmd]
-        stats["sent"] += 1
+        if stats is None:
+            stats = self._command_stats[cmd] = _CommandStats()
+        stats.sent += 1
         self._total_commands_sent += 1
 
         if success:
-            stats["success"] += 1
-            stats["last_success"] = timestamp
+            stats.success += 1
+            stats.last_success = timestamp
             self._total_commands_success += 1
             self._last_command_error = None
         else:
-            stats["failure"] += 1
-            stats["last_failure"] = timestamp
-            stats["last_error"] = error
+            stats.failure += 1
+            stats.last_failure = timestamp
+            stats.last_error = error
             self._total_commands_failure += 1
             self._last_command_error = error
 
     def record_notification(
-        self, sender: int, data: bytes, parsed: bool
+        self, sender: int, data: bytes | memoryview, parsed: bool
     ) -> None:
         """Record details of the latest notifications for diagnostics."""
         timestamp = time.time()
         command = data[3] if len(data) > 3 else None
-        payload = data[4:-1] if len(data) > 5 else b""
-
-        entry = {
-            "timestamp": timestamp,
-            "sender": sender,
-            "command": f"0x{command:02X}" if command is not None else None,
-            "frame_hex": data.hex(),
-            "payload_hex": payload.hex(),
-            "parsed": parsed,
-        }
-        self._notification_history.append(entry)
+        # One copy of the frame serves history, stats and waiters; hex is built
+        # only when diagnostics are requested.
+        frame = data if isinstance(data, bytes) else bytes(data)
+
+        self._notification_history.append(
+            (timestamp, sender, command, frame, parsed)
+        )
 
         if command is not None:
-            VERBOSE_LOGGER.debug(
-                "%s RX (addr=%s sender=%s) cmd=0x%02X payload=%s parsed=%s",
-                self._device_name,
-                self.address,
-                sender,
-                command,
-                payload.hex(),
-                parsed,
-            )
-            stats = self._command_stats[command]
-            stats["last_notification"] = timestamp
-            stats["last_notification_hex"] = data.hex()
+            if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+                VERBOSE_LOGGER.debug(
+                    "%s RX (addr=%s sender=%s) cmd=0x%02X payload=%s parsed=%s",
+                    self._device_name,
+                    self.address,
+                    sender,
+                    command,
+                    frame[4:-1].hex(),
+                    parsed,
+                )
+            self._last_notification_at[command] = timestamp
+            self._last_notification_frame[command] = frame
 
             # Signal response received if waiting (Venus Monitor pattern)
             if self._pending_command == command and self._response_event:
-                self._response_data = data
+                self._response_data = frame
                 self._response_event.set()
         else:
-            VERBOSE_LOGGER.debug(
-                "%s RX (addr=%s sender=%s) cmd=unknown frame=%s parsed=%s",
-                self._device_name,
-                self.address,
-                sender,
-                data.hex(),
-                parsed,
-            )
+            if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+                VERBOSE_LOGGER.debug(
+                    "%s RX (addr=%s sender=%s) cmd=unknown frame=%s parsed=%s",
+                    self._device_name,
+                    self.address,
+                    sender,
+                    frame.hex(),
+                    parsed,
+                )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _iso_timestamp(timestamp: float | None) -> str | None:
-        """Convert a timestamp to ISO format in UTC."""
+        """Convert a timestamp to ISO format in UTC.
+
+        History timestamps don't change, so repeated diagnostics reuse them.
+        """
         if timestamp is None:
             return None
         return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
 
+    @staticmethod
+    def _frame_hex(frame: bytes) -> dict[str, str]:
+        """Return hex dumps of a frame and its payload."""
+        return {
+            "payload_hex": frame[4:-1].hex() if len(frame) > 5 else "",
+            "frame_hex": frame.hex(),
+        }
+
+    @classmethod
+    def _command_entry(
+        cls, entry: tuple[float, int, bytes, int, bool, str | None]
+    ) -> dict[str, Any]:
+        """Return the diagnostics dict for a command history entry."""
+        timestamp, cmd, frame, attempts, success, error = entry
+        return {
+            "timestamp": cls._iso_timestamp(timestamp),
+            "command": _COMMAND_LABELS[cmd],
+            "attempts": attempts,
+            "success": success,
+            "error": error,
+            "response": "received" if success else "no_response" if error == "no_response" else "error",
+            **cls._frame_hex(frame),
+        }
+
+    @classmethod
+    def _notification_entry(
+        cls, entry: tuple[float, Any, int | None, bytes, bool]
+    ) -> dict[str, Any]:
+        """Return the diagnostics dict for a notification history entry."""
+        timestamp, sender, cmd, frame, parsed = entry
+        return {
+            "timestamp": cls._iso_timestamp(timestamp),
+            # bleak passes the characteristic object; keep only its handle.
+            "sender": getattr(sender, "handle", sender),
+            "command": _COMMAND_LABELS[cmd] if cmd is not None else None,
+            "parsed": parsed,
+            **cls._frame_hex(frame),
+        }
+
     def get_diagnostics(self) -> dict[str, Any]:
         """Return diagnostic information for this BLE device."""
         command_history = [
-            {
-                **{
-                    k: v
-                    for k, v in entry.items()
-                    if k != "timestamp"
-                },
-                "timestamp": self._iso_timestamp(entry["timestamp"]),
-            }
-            for entry in list(self._command_history)
+            self._command_entry(entry) for entry in self._command_history
         ]
-
         notification_history = [
-            {
-                **{
-                    k: v
-                    for k, v in entry.items()
-                    if k != "timestamp"
-                },
-                "timestamp": self._iso_timestamp(entry["timestamp"]),
-            }
-            for entry in list(self._notification_history)
+            self._notification_entry(entry) for entry in self._notification_history
         ]
 
         command_stats: dict[str, Any] = {}
-        for cmd, stats in self._command_stats.items():
-            sent = stats["sent"]
-            success = stats["success"]
+        for cmd in range(256):
+            stats = self._command_stats[cmd]
+            if stats is None:
+                if not self._last_notification_at[cmd]:
+                    continue
+                stats = _CommandStats()
+            sent = stats.sent
+            success = stats.success
             success_rate = (success / sent) if sent else None
-            command_stats[f"0x{cmd:02X}"] = {
+            frame = self._last_notification_frame[cmd]
+            command_stats[_COMMAND_LABELS[cmd]] = {
                 "sent": sent,
                 "success": success,
-                "failure": stats["failure"],
+                "failure": stats.failure,
                 "success_rate": round(success_rate * 100, 2) if success_rate is not None else None,
                 "ratio": f"{success}/{sent}" if sent else "0/0",
-                "last_success": self._iso_timestamp(stats.get("last_success")),
-                "last_failure": self._iso_timestamp(stats.get("last_failure")),
-                "last_notification": self._iso_timestamp(stats.get("last_notification")),
-                "last_notification_hex": stats.get("last_notification_hex"),
-                "last_error": stats.get("last_error"),
+                "last_success": self._iso_timestamp(stats.last_success),
+                "last_failure": self._iso_timestamp(stats.last_failure),
+                "last_notification": self._iso_timestamp(
+                    self._last_notification_at[cmd] or None
+                ),
+                "last_notification_hex": frame.hex() if frame else None,
+                "last_error": stats.last_error,
             }
 
         overall_sent = self._total_commands_sent
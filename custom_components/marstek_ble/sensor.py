@@ -674,19 +674,19 @@ class MarstekSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data with telemetry for debugging staleness."""
-        value = self.native_value
-        meta = self._get_representative_metadata()
-        VERBOSE_LOGGER.debug(
-            "[%s/%s] Sensor update %s=%s (source=%s ts=%s age=%.1fs payload=%s)",
-            self.coordinator.device_name,
-            self.coordinator.address,
-            self._key,
-            value,
-            meta.get("command_hex") if meta else "unknown",
-            meta.get("timestamp") if meta else "unknown",
-            meta.get("age_seconds", -1) if meta else -1,
-            meta.get("payload_hex") if meta else "unknown",
-        )
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            meta = self._get_representative_metadata()
+            VERBOSE_LOGGER.debug(
+                "[%s/%s] Sensor update %s=%s (source=%s ts=%s age=%.1fs payload=%s)",
+                self.coordinator.device_name,
+                self.coordinator.address,
+                self._key,
+                self.native_value,
+                meta.get("command_hex") if meta else "unknown",
+                meta.get("timestamp") if meta else "unknown",
+                meta.get("age_seconds", -1) if meta else -1,
+                meta.get("payload_hex") if meta else "unknown",
+            )
         super()._handle_coordinator_update()
 
     @property
@@ -708,14 +708,7 @@ class MarstekSensor(CoordinatorEntity, SensorEntity):
         if self.coordinator.data is None:
             return None
 
-        ages: list[float] = []
-        for field in self._stale_fields:
-            meta = self.coordinator.data.get_field_metadata(field)
-            if not meta or meta.get("age_seconds") is None:
-                continue
-            ages.append(meta["age_seconds"])
-
-        return max(ages) if ages else None
+        return self.coordinator.data.oldest_field_age(self._stale_fields)
 
     def _get_representative_metadata(self) -> dict | None:
         """Return metadata for logging from the first available field."""
@@ -765,19 +758,19 @@ class MarstekTextSensor(CoordinatorEntity, SensorEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data with telemetry for debugging staleness."""
-        value = self.native_value
-        meta = self._get_representative_metadata()
-        VERBOSE_LOGGER.debug(
-            "[%s/%s] Sensor update %s=%s (source=%s ts=%s age=%.1fs payload=%s)",
-            self.coordinator.device_name,
-            self.coordinator.address,
-            self._key,
-            value,
-            meta.get("command_hex") if meta else "unknown",
-            meta.get("timestamp") if meta else "unknown",
-            meta.get("age_seconds", -1) if meta else -1,
-            meta.get("payload_hex") if meta else "unknown",
-        )
+        if VERBOSE_LOGGER.isEnabledFor(logging.DEBUG):
+            meta = self._get_representative_metadata()
+            VERBOSE_LOGGER.debug(
+                "[%s/%s] Sensor update %s=%s (source=%s ts=%s age=%.1fs payload=%s)",
+                self.coordinator.device_name,
+                self.coordinator.address,
+                self._key,
+                self.native_value,
+                meta.get("command_hex") if meta else "unknown",
+                meta.get("timestamp") if meta else "unknown",
+                meta.get("age_seconds", -1) if meta else -1,
+                meta.get("payload_hex") if meta else "unknown",
+            )
         super()._handle_coordinator_update()
 
     @property
@@ -800,14 +793,7 @@ class MarstekTextSensor(CoordinatorEntity, SensorEntity):
         if self.coordinator.data is None:
             return None
 
-        ages: list[float] = []
-        for field in self._stale_fields:
-            meta = self.coordinator.data.get_field_metadata(field)
-            if not meta or meta.get("age_seconds") is None:
-                continue
-            ages.append(meta["age_seconds"])
-
-        return max(ages) if ages else None
+        return self.coordinator.data.oldest_field_age(self._stale_fields)
 
     def _get_representative_metadata(self) -> dict | None:
         """Return metadata for logging from the first available field."""
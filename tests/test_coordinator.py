@@ -0,0 +1,383 @@
+"""Tests for the coordinator's polling and adaptive scheduling."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import partialmethod
+import logging
+from types import SimpleNamespace
+
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
+from homeassistant.core import CoreState
+import pytest
+
+from custom_components.marstek_ble import coordinator as coordinator_module
+from custom_components.marstek_ble.const import (
+    ADAPTIVE_MIN_SAMPLES,
+    AIMD_INCREASE,
+    BACKOFF_INTERVALS,
+    BACKOFF_JITTER,
+    CMD_LOGS,
+    CMD_WIFI_SSID,
+    DATA_POLL_SLOTS,
+    DOMAIN,
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    PIPELINE_DEPTH,
+    POLLING_STYLE_AIMD,
+    POLLING_STYLE_MIMD,
+    UNANSWERED_COMMAND_LIMIT,
+)
+from custom_components.marstek_ble.coordinator import (
+    MarstekDataUpdateCoordinator,
+    _ChangeModel,
+)
+from custom_components.marstek_ble.marstek_device import MarstekProtocol
+
+FAST = [cmd for cmd, _, _ in MarstekDataUpdateCoordinator._FAST_COMMANDS]
+MEDIUM = [cmd for cmd, _, _ in MarstekDataUpdateCoordinator._MEDIUM_COMMANDS]
+
+
+def _model(*intervals: float) -> _ChangeModel:
+    model = _ChangeModel()
+    for interval in intervals:
+        model.add(interval)
+    return model
+
+
+def test_change_model_ready_after_min_samples() -> None:
+    """The model is trusted only once enough changes were seen."""
+    model = _model(10, 10, 20, 20)
+    assert not model.ready
+    model.add(30)
+    assert model.ready
+
+
+def test_change_model_next_offset_follows_recurrence() -> None:
+    """L_i = L_{i-1} + (F(L_{i-1}) - F(L_{i-2})) / p(L_{i-1})."""
+    model = _model(10, 10, 20, 20, 30)
+    # F(10) = 0.4, F(0) = 0, p(10) = 2 / 5 / 10 = 0.04 -> 10 + 0.4 / 0.04.
+    assert model.next_offset(0, 10, 10) == pytest.approx(20)
+
+
+def test_change_model_empty_bin_skips_to_next_change() -> None:
+    """An empty bin jumps to the next offset where a change was observed."""
+    model = _model(10, 10, 20, 20, 30)
+    assert model.next_offset(20, 22, 2) == 30
+
+
+def test_change_model_no_later_change_returns_none() -> None:
+    """Past every observed change, no further change is expected."""
+    model = _model(10, 10, 20, 20, 30)
+    assert model.next_offset(30, 40, 10) is None
+
+
+def _retune(
+    style: str,
+    interval: int,
+    deltas: list[float],
+    medium_interval: int = 300,
+) -> SimpleNamespace:
+    """Run _synchronize_poll_rate on a stand-in carrying only what it reads."""
+    coordinator = SimpleNamespace(
+        device_name="Test",
+        address="AA:BB:CC:DD:EE:FF",
+        _polling_style=style,
+        _poll_interval=interval,
+        _medium_poll_interval=medium_interval,
+        _volatility={"battery_soc": list(deltas), "battery_current": []},
+        schedule_updates=0,
+    )
+
+    def _update_poll_schedule() -> None:
+        coordinator.schedule_updates += 1
+
+    coordinator._update_poll_schedule = _update_poll_schedule
+    MarstekDataUpdateCoordinator._synchronize_poll_rate(coordinator)
+    return coordinator
+
+
+def test_quiet_window_aimd_adds_increase() -> None:
+    """A quiet AIMD window adds a fixed step."""
+    coordinator = _retune(POLLING_STYLE_AIMD, 10, [0.0] * 5)
+    assert coordinator._poll_interval == 10 + AIMD_INCREASE
+    assert coordinator.schedule_updates == 1
+
+
+def test_quiet_window_mimd_multiplies() -> None:
+    """A quiet MIMD window scales the interval, rounding up."""
+    coordinator = _retune(POLLING_STYLE_MIMD, 5, [0.0] * 5)
+    assert coordinator._poll_interval == 8
+
+
+def test_quiet_window_clamped_to_max_interval() -> None:
+    """Growth stops at MAX_POLL_INTERVAL."""
+    coordinator = _retune(POLLING_STYLE_MIMD, MAX_POLL_INTERVAL - 1, [0.0] * 5)
+    assert coordinator._poll_interval == MAX_POLL_INTERVAL
+
+
+def test_quiet_window_clamped_to_medium_interval() -> None:
+    """The fast interval never outgrows the medium interval."""
+    coordinator = _retune(POLLING_STYLE_AIMD, 10, [0.0] * 5, medium_interval=12)
+    assert coordinator._poll_interval == 12
+
+
+def test_busy_window_halves_down_to_min_interval() -> None:
+    """A busy window halves the interval but not below MIN_POLL_INTERVAL."""
+    assert _retune(POLLING_STYLE_AIMD, 20, [5.0] * 5)._poll_interval == 10
+    coordinator = _retune(POLLING_STYLE_AIMD, MIN_POLL_INTERVAL, [5.0] * 5)
+    assert coordinator._poll_interval == MIN_POLL_INTERVAL
+    assert coordinator.schedule_updates == 0
+
+
+class _FakeDevice:
+    """Stand-in for MarstekBLEDevice that answers through the coordinator."""
+
+    def __init__(self, coordinator: MarstekDataUpdateCoordinator) -> None:
+        self.coordinator = coordinator
+        self.supports_pipelining = True
+        self.auto_reply = True
+        self.silent: set[int] = set()
+        self.connect_error: Exception | None = None
+        self.writes: list[int] = []
+
+    @asynccontextmanager
+    async def connected(self) -> AsyncIterator[None]:
+        if self.connect_error is not None:
+            raise self.connect_error
+        yield
+
+    def reply(self, cmd: int, payload: bytes = b"") -> None:
+        frame = MarstekProtocol.build_command(cmd, payload)
+        self.coordinator._handle_notification(0, bytearray(frame))
+
+    async def write_command(self, cmd: int, payload: bytes = b"") -> bytes:
+        self.writes.append(cmd)
+        if self.auto_reply and cmd not in self.silent:
+            asyncio.get_running_loop().call_soon(self.reply, cmd)
+        return MarstekProtocol.build_command(cmd, payload)
+
+    def set_idle_timeout(self, seconds: float) -> None:
+        pass
+
+    def record_command_result(self, **kwargs: object) -> None:
+        pass
+
+    def record_notification(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _isolate_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test without a global backoff and with fast reply timeouts."""
+    monkeypatch.setattr(coordinator_module, "_GLOBAL_BACKOFF_LEVEL", 0)
+    monkeypatch.setattr(coordinator_module, "_GLOBAL_BACKOFF_UNTIL", None)
+    monkeypatch.setattr(coordinator_module, "_GLOBAL_BACKOFF_OWNER", None)
+    monkeypatch.setattr(
+        MarstekDataUpdateCoordinator,
+        "_send_and_await",
+        partialmethod(MarstekDataUpdateCoordinator._send_and_await, timeout=0.01),
+    )
+    monkeypatch.setattr(
+        "homeassistant.components.bluetooth.update_coordinator.async_address_present",
+        lambda *args: False,
+    )
+
+
+def _hass() -> SimpleNamespace:
+    """Return the parts of Home Assistant the coordinator touches."""
+    return SimpleNamespace(
+        loop=asyncio.get_running_loop(), data={}, state=CoreState.running
+    )
+
+
+def _coordinator(
+    hass: SimpleNamespace, address: str = "AA:BB:CC:DD:EE:FF"
+) -> MarstekDataUpdateCoordinator:
+    """Build a coordinator wired to a fake device, with no time polls."""
+    ble_device = BLEDevice(address, "Test", None)
+    coordinator = MarstekDataUpdateCoordinator(
+        hass, logging.getLogger(__name__), address, ble_device, "Test"
+    )
+    coordinator._cancel_time_poll()
+    coordinator._stopped = True
+    coordinator.device = _FakeDevice(coordinator)
+    return coordinator
+
+
+def _service_info(coordinator: MarstekDataUpdateCoordinator) -> SimpleNamespace:
+    return SimpleNamespace(device=coordinator.ble_device, time=0.0, name="Test")
+
+
+async def _settle() -> None:
+    """Let every ready task and call_soon callback run."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_keeps_window_full() -> None:
+    """Each reply frees a window slot for the next command."""
+    hass = _hass()
+    coordinator = _coordinator(hass)
+    device = coordinator.device
+    device.auto_reply = False
+
+    run = asyncio.ensure_future(
+        coordinator._run_commands(list(coordinator._MEDIUM_COMMANDS))
+    )
+    await _settle()
+    assert device.writes == MEDIUM[:PIPELINE_DEPTH]
+
+    device.reply(device.writes[1])
+    await _settle()
+    assert device.writes == MEDIUM[: PIPELINE_DEPTH + 1]
+
+    while not run.done():
+        for cmd in list(coordinator._pending):
+            device.reply(cmd)
+        await _settle()
+    await run
+    assert device.writes == MEDIUM
+    assert all(entry["success"] for entry in coordinator.poll_command_history())
+    coordinator._flush_updates()
+
+
+@pytest.mark.asyncio
+async def test_overlapping_polls_share_in_flight_poll() -> None:
+    """Concurrent triggers get the running poll's data, not a second burst."""
+    hass = _hass()
+    coordinator = _coordinator(hass)
+    service_info = _service_info(coordinator)
+
+    results = await asyncio.gather(
+        *(coordinator._async_poll_once(service_info) for _ in range(3))
+    )
+    assert results[0] is results[1] is results[2] is coordinator.data
+    assert coordinator.device.writes == FAST + MEDIUM
+    assert coordinator._poll_in_flight is None
+
+
+async def _poll(coordinator: MarstekDataUpdateCoordinator) -> None:
+    """Run a full poll with the medium tier due and no backoff in the way."""
+    coordinator_module._GLOBAL_BACKOFF_UNTIL = None
+    coordinator._next_medium_mono = 0.0
+    await coordinator._async_poll_once(_service_info(coordinator))
+
+
+@pytest.mark.asyncio
+async def test_unanswered_command_dropped_and_reprobed() -> None:
+    """A medium command that never answers is dropped until the device returns."""
+    hass = _hass()
+    coordinator = _coordinator(hass)
+    coordinator.device.silent.add(CMD_LOGS)
+
+    for _ in range(UNANSWERED_COMMAND_LIMIT):
+        assert CMD_LOGS in [cmd for cmd, _, _ in coordinator._due_medium_commands()]
+        await _poll(coordinator)
+
+    assert coordinator._dropped_commands == [CMD_LOGS]
+    assert CMD_LOGS not in [cmd for cmd, _, _ in coordinator._due_medium_commands()]
+
+    coordinator._async_handle_unavailable(_service_info(coordinator))
+    assert coordinator._dropped_commands == []
+    assert CMD_LOGS in [cmd for cmd, _, _ in coordinator._due_medium_commands()]
+
+
+@pytest.mark.asyncio
+async def test_silent_device_ends_poll_early() -> None:
+    """A poll stops issuing commands once POLL_MISS_LIMIT go unanswered."""
+    hass = _hass()
+    coordinator = _coordinator(hass)
+    coordinator.device.silent.update(FAST + MEDIUM)
+
+    await _poll(coordinator)
+    # Commands already let into the window still go out.
+    assert coordinator.device.writes == FAST + MEDIUM[:PIPELINE_DEPTH]
+
+
+@pytest.mark.asyncio
+async def test_poll_slots_shared_per_hass() -> None:
+    """Entries of one Home Assistant instance share their poll slots."""
+    hass = _hass()
+    first = _coordinator(hass)
+    second = _coordinator(hass, "11:22:33:44:55:66")
+    assert first._poll_slots is second._poll_slots
+    assert hass.data[DOMAIN][DATA_POLL_SLOTS] is first._poll_slots
+
+    other = _coordinator(SimpleNamespace(loop=hass.loop, data={}))
+    assert other._poll_slots is not first._poll_slots
+
+
+@pytest.mark.asyncio
+async def test_failed_poll_pauses_every_device_staggered() -> None:
+    """A connect failure pauses all devices, each resuming at its own offset."""
+    hass = _hass()
+    failing = _coordinator(hass)
+    healthy = _coordinator(hass, "11:22:33:44:55:66")
+    failing.device.connect_error = BleakError("out of range")
+
+    await failing._async_poll_once(_service_info(failing))
+    await healthy._async_poll_once(_service_info(healthy))
+    assert healthy.device.writes == []
+
+    until = coordinator_module._GLOBAL_BACKOFF_UNTIL
+    window = BACKOFF_INTERVALS[1]
+    resume = [failing._backoff_resume_at(), healthy._backoff_resume_at()]
+    assert resume[0] != resume[1]
+    for resume_at in resume:
+        assert until <= resume_at <= until + BACKOFF_JITTER * window
+
+
+@pytest.mark.asyncio
+async def test_backoff_eased_only_by_device_that_raised_it() -> None:
+    """Another device's success doesn't cancel the failing device's pause."""
+    hass = _hass()
+    failing = _coordinator(hass)
+    healthy = _coordinator(hass, "11:22:33:44:55:66")
+    failing._handle_backoff(True)
+    failing._handle_backoff(True)
+    until = coordinator_module._GLOBAL_BACKOFF_UNTIL
+
+    healthy._handle_backoff(False)
+    assert coordinator_module._GLOBAL_BACKOFF_LEVEL == 2
+    assert coordinator_module._GLOBAL_BACKOFF_UNTIL == until
+
+    failing._handle_backoff(False)
+    assert coordinator_module._GLOBAL_BACKOFF_LEVEL == 1
+    assert coordinator_module._GLOBAL_BACKOFF_UNTIL is None
+
+
+@pytest.mark.asyncio
+async def test_stable_reply_skips_medium_cycles() -> None:
+    """Once changes were learned, an unchanged reply defers the next poll."""
+    hass = _hass()
+    coordinator = _coordinator(hass)
+    coordinator._initial_poll_done = True
+    clock = [0.0]
+    coordinator._now = lambda: clock[0]
+
+    # The SSID changes every 240s, enough times to trust the model.
+    for change in range(ADAPTIVE_MIN_SAMPLES + 1):
+        clock[0] = change * 240.0
+        coordinator.device.reply(CMD_WIFI_SSID, b"net-%d" % change)
+    assert coordinator._change_models[CMD_WIFI_SSID].ready
+
+    # One medium interval after the last change it is seen unchanged: the
+    # next change is expected 240s in, so the next two medium cycles skip it.
+    last_change = clock[0]
+    clock[0] = last_change + 60
+    coordinator.device.reply(CMD_WIFI_SSID, b"net-%d" % ADAPTIVE_MIN_SAMPLES)
+
+    def due() -> list[int]:
+        return [cmd for cmd, _, _ in coordinator._due_medium_commands()]
+
+    for offset in (120, 180):
+        clock[0] = last_change + offset
+        assert CMD_WIFI_SSID not in due()
+        assert set(due()) == set(MEDIUM) - {CMD_WIFI_SSID}
+    clock[0] = last_change + 210
+    assert CMD_WIFI_SSID in due()
+    coordinator._flush_updates()
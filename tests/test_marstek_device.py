@@ -0,0 +1,101 @@
+"""Regression tests for the Marstek BLE protocol parser and device link.
+
+parser_golden.json was recorded with the original per-field parsers, so the
+struct/memoryview based ones must reproduce it exactly.
+"""
+from __future__ import annotations
+
+from dataclasses import fields
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
+import pytest
+
+from custom_components.marstek_ble import marstek_device
+from custom_components.marstek_ble.marstek_device import (
+    MarstekBLEDevice,
+    MarstekData,
+    MarstekProtocol,
+)
+
+GOLDEN = json.loads(
+    (Path(__file__).parent / "fixtures" / "parser_golden.json").read_text()
+)
+
+
+@pytest.mark.parametrize(
+    "case", GOLDEN["notifications"], ids=lambda case: case["frame"][:8]
+)
+def test_parse_notification_matches_golden(case: dict) -> None:
+    """Every field, and its update metadata, matches the recorded parse."""
+    frame = bytes.fromhex(case["frame"])
+    data = MarstekData()
+
+    assert MarstekProtocol.parse_notification(bytearray(frame), data) is case["parsed"]
+
+    defaults = MarstekData()
+    expected = {
+        field.name: getattr(defaults, field.name)
+        for field in fields(MarstekData)
+        if field.name != "field_updates"
+    }
+    expected.update(case["values"])
+    actual = {name: getattr(data, name) for name in expected}
+    assert actual == expected
+
+    assert sorted(data.field_updates) == case["fields"]
+    for name in case["fields"]:
+        meta = data.get_field_metadata(name)
+        assert meta["command"] == frame[3]
+        assert meta["payload_hex"] == frame[4:-1].hex()
+
+
+@pytest.mark.parametrize(("cmd", "payload", "frame"), GOLDEN["commands"])
+def test_build_command_matches_golden(cmd: int, payload: str, frame: str) -> None:
+    """Command frames are byte-for-byte unchanged."""
+    assert MarstekProtocol.build_command(cmd, bytes.fromhex(payload)).hex() == frame
+
+
+@pytest.mark.asyncio
+async def test_failed_connects_clear_services_cache_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The cache is cleared once per run of failed connects, never while live."""
+    cleared: list[str] = []
+    outcomes: list[object] = []
+
+    async def _establish_connection(*args: object, **kwargs: object) -> object:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def _clear_cache(address: str) -> bool:
+        cleared.append(address)
+        return True
+
+    monkeypatch.setattr(marstek_device, "establish_connection", _establish_connection)
+    monkeypatch.setattr(marstek_device, "clear_cache", _clear_cache)
+    device = MarstekBLEDevice(BLEDevice("AA:BB:CC:DD:EE:FF", "Test", None), "Test")
+
+    outcomes.extend([BleakError("out of range"), TimeoutError()])
+    for _ in range(2):
+        with pytest.raises((BleakError, TimeoutError)):
+            await device._ensure_connected()
+    assert cleared == ["AA:BB:CC:DD:EE:FF"]
+
+    client = SimpleNamespace(is_connected=True)
+    outcomes.append(client)
+    await device._ensure_connected()
+    await device._clear_services_cache()
+    assert cleared == ["AA:BB:CC:DD:EE:FF"]
+
+    # A successful connect starts a new run of failures.
+    client.is_connected = False
+    outcomes.append(BleakError("out of range"))
+    with pytest.raises(BleakError):
+        await device._ensure_connected()
+    assert cleared == ["AA:BB:CC:DD:EE:FF"] * 2